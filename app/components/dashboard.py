@@ -1,11 +1,168 @@
 """
 Reusable dashboard components
 """
+import types
 import streamlit as st
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import pandas as pd
-from typing import Dict, List, Any
+import numpy as np
+from typing import TYPE_CHECKING, Dict, List, Any, Tuple
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Rows beyond this are rendered without Styler formatting
+MAX_STYLE_ROWS = 200
+
+_SKILL_COLORS = types.MappingProxyType({
+    "beginner": "#3B82F6",
+    "intermediate": "#8B5CF6",
+    "advanced": "#EF4444"
+})
+
+_DEMAND_ICONS = types.MappingProxyType({
+    "very high": "🔥",
+    "high": "📈",
+    "medium": "📊",
+    "low": "📉",
+    "niche": "🎯"
+})
+
+_SKILL_CARD_TEMPLATE = """
+<div style="
+    background: linear-gradient(135deg, {color}20, #ffffff);
+    border-left: 4px solid {color};
+    padding: 1rem;
+    margin: 0.5rem 0;
+    border-radius: 0 8px 8px 0;
+">
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+        <div>
+            <h4 style="margin: 0; color: #1F2937;">{skill_title}</h4>
+            <p style="margin: 0.25rem 0; color: #6B7280; font-size: 0.9rem;">
+                Level: <span style="color: {color}; font-weight: bold;">{level_title}</span>
+            </p>
+        </div>
+        <div style="text-align: right;">
+            <p style="margin: 0; color: #6B7280; font-size: 0.9rem;">
+                {demand_icon} {demand_title} Demand
+            </p>
+            <p style="margin: 0; color: #6B7280; font-size: 0.9rem;">
+                ⏱️ {hours} hours
+            </p>
+        </div>
+    </div>
+</div>
+"""
+
+def _skill_card_html(skill: str, level: str, demand: str, hours: int) -> str:
+    """Render the skill card template"""
+    return _SKILL_CARD_TEMPLATE.format_map({
+        'color': _SKILL_COLORS.get(level, '#3B82F6'),
+        'skill_title': skill.title(),
+        'level_title': level.title(),
+        'demand_icon': _DEMAND_ICONS.get(demand, '📊'),
+        'demand_title': demand.title(),
+        'hours': hours,
+    })
+
+# Figure factories are cached per argument tuple so identical charts are not
+# rebuilt on every rerun. st.cache_data hands each caller its own copy, so
+# callers may update the returned figures freely.
+@st.cache_data(max_entries=128, show_spinner=False)
+def _cached_gauge(value: float, title: str, min_val: float, max_val: float) -> "go.Figure":
+    """Build a gauge chart"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=value,
+        title={'text': title},
+        domain={'x': [0, 1], 'y': [0, 1]},
+        gauge={
+            'axis': {'range': [min_val, max_val]},
+            'bar': {'color': "#2563EB"},
+            'steps': [
+                {'range': [min_val, max_val * 0.6], 'color': "lightgray"},
+                {'range': [max_val * 0.6, max_val * 0.8], 'color': "gray"},
+                {'range': [max_val * 0.8, max_val], 'color': "darkgray"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': max_val * 0.8
+            }
+        }
+    ))
+    
+    fig.update_layout(height=200, margin=dict(l=20, r=20, t=50, b=20))
+    return fig
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _cached_radar(categories: Tuple[str, ...], values: Tuple[float, ...], 
+                  title: str) -> "go.Figure":
+    """Build a radar chart"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=go.Scatterpolar(
+        r=values + values[:1],  # Close the shape
+        theta=categories + categories[:1],
+        fill='toself',
+        fillcolor='rgba(37, 99, 235, 0.3)',
+        line_color='rgb(37, 99, 235)'
+    ))
+    
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, max(values) * 1.2]
+            )
+        ),
+        showlegend=False,
+        title=title,
+        height=400
+    )
+    
+    return fig
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _cached_timeline(milestones: Tuple[Tuple[Any, str, str], ...]) -> "go.Figure":
+    """Build a timeline visualization from (month, title, description) tuples"""
+    import plotly.graph_objects as go
+    
+    # One trace for every milestone; NaN entries break the line between them
+    n = len(milestones)
+    xs = np.repeat(np.arange(n, dtype=np.float64), 3)
+    xs[2::3] = np.nan
+    ys = np.tile(np.array([0.0, 1.0, np.nan]), n)
+    texts, hovers = [], []
+    for month, title, description in milestones:
+        texts += [f"Month {month}", description, None]
+        hovers += [title, title, None]
+    
+    fig = go.Figure(go.Scatter(
+        x=xs,
+        y=ys,
+        mode='lines+markers+text',
+        line=dict(color='#2563EB', width=2),
+        marker=dict(size=10, color='#2563EB'),
+        text=texts,
+        hovertext=hovers,
+        textposition="top center",
+        name="Milestones"
+    ))
+    
+    fig.update_layout(
+        title="Learning Timeline",
+        xaxis=dict(showticklabels=False, showgrid=False),
+        yaxis=dict(showticklabels=False, showgrid=False),
+        showlegend=False,
+        height=300,
+        margin=dict(l=20, r=20, t=50, b=20)
+    )
+    
+    return fig
+
 
 class DashboardComponents:
     """Reusable dashboard components"""
@@ -30,139 +187,60 @@ class DashboardComponents:
     def skill_card(skill: str, level: str = "intermediate", 
                   demand: str = "high", hours: int = 40):
         """Create a skill card"""
-        colors = {
-            "beginner": "#3B82F6",
-            "intermediate": "#8B5CF6",
-            "advanced": "#EF4444"
-        }
-        
-        demand_icons = {
-            "very high": "🔥",
-            "high": "📈",
-            "medium": "📊",
-            "low": "📉",
-            "niche": "🎯"
-        }
-        
-        st.markdown(f"""
-        <div style="
-            background: linear-gradient(135deg, {colors.get(level, '#3B82F6')}20, #ffffff);
-            border-left: 4px solid {colors.get(level, '#3B82F6')};
-            padding: 1rem;
-            margin: 0.5rem 0;
-            border-radius: 0 8px 8px 0;
-        ">
-            <div style="display: flex; justify-content: space-between; align-items: center;">
-                <div>
-                    <h4 style="margin: 0; color: #1F2937;">{skill.title()}</h4>
-                    <p style="margin: 0.25rem 0; color: #6B7280; font-size: 0.9rem;">
-                        Level: <span style="color: {colors.get(level, '#3B82F6')}; font-weight: bold;">{level.title()}</span>
-                    </p>
-                </div>
-                <div style="text-align: right;">
-                    <p style="margin: 0; color: #6B7280; font-size: 0.9rem;">
-                        {demand_icons.get(demand, '📊')} {demand.title()} Demand
-                    </p>
-                    <p style="margin: 0; color: #6B7280; font-size: 0.9rem;">
-                        ⏱️ {hours} hours
-                    </p>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_skill_card_html(skill, level, demand, hours), unsafe_allow_html=True)
+    
+    @staticmethod
+    def skill_cards(skills: List[str], level: str = "intermediate", 
+                   demand: str = "high", hours: int = 40):
+        """Create several skill cards in a single markdown element"""
+        # Test the joined string, not `skills`, so Series/arrays of names work too
+        html = "".join(_skill_card_html(skill, level, demand, hours) for skill in skills)
+        if html:
+            st.markdown(html, unsafe_allow_html=True)
     
     @staticmethod
     def create_gauge_chart(value: float, title: str = "Score", 
                           min_val: float = 0, max_val: float = 100):
         """Create a gauge chart"""
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=value,
-            title={'text': title},
-            domain={'x': [0, 1], 'y': [0, 1]},
-            gauge={
-                'axis': {'range': [min_val, max_val]},
-                'bar': {'color': "#2563EB"},
-                'steps': [
-                    {'range': [min_val, max_val * 0.6], 'color': "lightgray"},
-                    {'range': [max_val * 0.6, max_val * 0.8], 'color': "gray"},
-                    {'range': [max_val * 0.8, max_val], 'color': "darkgray"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': max_val * 0.8
-                }
-            }
-        ))
-        
-        fig.update_layout(height=200, margin=dict(l=20, r=20, t=50, b=20))
-        return fig
+        return _cached_gauge(value, title, min_val, max_val)
     
     @staticmethod
     def create_radar_chart(categories: List[str], values: List[float], 
                           title: str = "Skill Profile"):
         """Create a radar chart"""
-        fig = go.Figure(data=go.Scatterpolar(
-            r=values + [values[0]],  # Close the shape
-            theta=categories + [categories[0]],
-            fill='toself',
-            fillcolor='rgba(37, 99, 235, 0.3)',
-            line_color='rgb(37, 99, 235)'
-        ))
-        
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, max(values) * 1.2]
-                )
-            ),
-            showlegend=False,
-            title=title,
-            height=400
-        )
-        
-        return fig
+        return _cached_radar(tuple(categories), tuple(values), title)
     
     @staticmethod
     def create_timeline_chart(milestones: List[Dict]):
         """Create a timeline visualization"""
-        fig = go.Figure()
-        
-        for i, milestone in enumerate(milestones):
-            fig.add_trace(go.Scatter(
-                x=[i, i],
-                y=[0, 1],
-                mode='lines+markers+text',
-                line=dict(color='#2563EB', width=2),
-                marker=dict(size=10, color='#2563EB'),
-                text=[f"Month {milestone['month']}", milestone['description']],
-                textposition="top center",
-                name=milestone['title']
-            ))
-        
-        fig.update_layout(
-            title="Learning Timeline",
-            xaxis=dict(showticklabels=False, showgrid=False),
-            yaxis=dict(showticklabels=False, showgrid=False),
-            showlegend=False,
-            height=300,
-            margin=dict(l=20, r=20, t=50, b=20)
-        )
-        
-        return fig
+        key = tuple((m['month'], m['title'], m['description']) for m in milestones)
+        return _cached_timeline(key)
     
     @staticmethod
     def create_comparison_table(data: pd.DataFrame, title: str = "Comparison"):
         """Create a styled comparison table"""
         st.markdown(f"### {title}")
         
+        # Styler emits per-cell CSS, so large tables get column formats instead
+        if len(data) > MAX_STYLE_ROWS:
+            st.dataframe(
+                data,
+                use_container_width=True,
+                column_config={
+                    'Salary Increase': st.column_config.NumberColumn(format="$%.0f"),
+                    'ROI Score': st.column_config.NumberColumn(format="%.1f"),
+                    'Months to Break Even': st.column_config.NumberColumn(format="%.1f"),
+                },
+            )
+            return
+        
         # Style the dataframe
         styled_df = data.style.format({
             'Salary Increase': '${:,.0f}',
             'ROI Score': '{:.1f}',
             'Months to Break Even': '{:.1f}'
-        }).background_gradient(subset=['ROI Score'], cmap='RdYlGn')
+        })
+        if 'ROI Score' in data.columns:
+            styled_df = styled_df.background_gradient(subset=['ROI Score'], cmap='RdYlGn')
         
-        st.dataframe(styled_df, use_container_width=True)
\ No newline at end of file
+        st.dataframe(styled_df, use_container_width=True)
@@ -4,33 +4,104 @@ Professional portfolio project with real data collection
 """
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import numpy as np
 import sys
 import os
+import re
+import types
+import string
+import textwrap
+import time
+import logging
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Final, FrozenSet, List, Mapping, Tuple
+
+logger = logging.getLogger(__name__)
 
 # Add project root to path
 current_dir = Path(__file__).parent
 project_root = current_dir.parent
-sys.path.append(str(project_root))
-
-# Try to import our modules with error handling
-try:
-    from src.data.job_scraper import FreeJobDataCollector
-    from src.features.skill_extractor import SkillExtractor
-    DATA_MODULES_AVAILABLE = True
-except ImportError as e:
-    st.warning(f"⚠️ Some modules not available: {e}")
-    DATA_MODULES_AVAILABLE = False
-    # Create mock classes for demonstration
-    class FreeJobDataCollector:
-        def collect_all_data(self):
-            return pd.DataFrame()
-    class SkillExtractor:
-        def extract_skills(self, text):
-            return []
+if str(project_root) not in sys.path:
+    sys.path.append(str(project_root))
+
+from app.utils.helpers import compat_fragment
+
+# Stand-ins used when the data modules or settings cannot be imported
+class _FallbackJobDataCollector:
+    def collect_all_data(self, use_cache=True):
+        # Return sample data if modules aren't available
+        return pd.DataFrame({
+            'title': ['Data Scientist', 'Machine Learning Engineer', 'Data Analyst'],
+            'company': ['TechCorp', 'DataWorks', 'AnalyticsPro'],
+            'location': ['Remote', 'San Francisco, CA', 'New York, NY'],
+            'source': ['stack_overflow', 'github_jobs', 'reed_uk_sample'],
+            'data_quality': ['real', 'real', 'sample']
+        })
+
+class _FallbackSkillExtractor:
+    def extract_skills(self, text):
+        return []
+
+class _FallbackSettings:
+    """Defaults used when config.settings cannot be imported"""
+    APP_NAME = "Career Compass AI"
+    VERSION = "1.0.0"
+    DEBUG = False
+    ENABLE_REAL_API_CALLS = False
+    DEFAULT_HOURS_PER_WEEK = 10
+    DEFAULT_TIMELINE_MONTHS = 6
+
+@st.cache_resource
+def _fallback_notices() -> List[str]:
+    """Fallback messages recorded while building the shared resources below"""
+    return []
+
+def _notify_fallback(message: str) -> None:
+    """Log a fallback and queue it for a one-time notice in every session"""
+    logger.warning(message)
+    _fallback_notices().append(message)
+
+def _show_fallback_notices() -> None:
+    """Toast each queued fallback message once per session"""
+    shown = st.session_state.setdefault("_fallback_notices_shown", set())
+    for message in _fallback_notices():
+        if message not in shown:
+            st.toast(message)
+            shown.add(message)
+
+@st.cache_resource
+def get_settings():
+    """Load application settings once per process"""
+    try:
+        from config.settings import init_dirs, settings
+        init_dirs()
+        return settings
+    except ImportError as e:
+        _notify_fallback(f"⚠️ Settings not available, using defaults: {e}")
+        return _FallbackSettings()
+
+# The data modules pull in HTTP/parsing dependencies, so they are imported
+# on first use rather than at the top of every script run
+@st.cache_resource
+def get_collector():
+    """Shared job data collector, created once per process"""
+    try:
+        from src.data.job_scraper import FreeJobDataCollector
+    except ImportError as e:
+        _notify_fallback(f"⚠️ Some modules not available: {e}")
+        return _FallbackJobDataCollector()
+    return FreeJobDataCollector()
+
+@st.cache_resource
+def get_extractor():
+    """Shared skill extractor, created once per process"""
+    try:
+        from src.features.skill_extractor import SkillExtractor
+    except ImportError as e:
+        _notify_fallback(f"⚠️ Some modules not available: {e}")
+        return _FallbackSkillExtractor()
+    return SkillExtractor()
 
 # Page configuration
 st.set_page_config(
@@ -45,152 +116,385 @@ st.set_page_config(
     }
 )
 
-# Custom CSS for professional look
-st.markdown("""
-<style>
-    /* Main header */
-    .main-header {
-        font-size: 3rem;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        margin-bottom: 0.5rem;
-        font-weight: 800;
-    }
+# Custom CSS for professional look, kept in app/assets/style.css
+_STYLE_PATH = current_dir / "assets" / "style.css"
+
+@st.cache_resource
+def load_css() -> str:
+    """Read the stylesheet once per process, minified to shrink the delta sent on every rerun"""
+    css = _STYLE_PATH.read_text(encoding="utf-8")
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css).strip()
+    return "<style>" + css + "</style>"
+
+# Initialize session state
+if 'data_loaded' not in st.session_state:
+    st.session_state.data_loaded = False
+if 'jobs_df' not in st.session_state:
+    st.session_state.jobs_df = None
+# The skill extractor is not kept per session; call get_extractor() where needed
+
+# Static reference data, built once at import instead of on every rerun
+# Skill requirements by role (this would come from your ML model)
+_ROLE_REQUIREMENTS: Final[Mapping[str, Tuple[str, ...]]] = types.MappingProxyType({
+    "Data Scientist": ("Python", "SQL", "Machine Learning", "Statistics", 
+                     "Data Visualization", "A/B Testing", "Communication"),
+    "Machine Learning Engineer": ("Python", "Docker", "AWS", "MLOps", 
+                                "TensorFlow", "CI/CD", "Kubernetes", "System Design"),
+    "Data Engineer": ("SQL", "Python", "Spark", "AWS", "Airflow", 
+                    "Kafka", "Data Pipelines", "Data Warehousing"),
+    "MLOps Engineer": ("Docker", "Kubernetes", "AWS", "MLOps", 
+                     "CI/CD", "Monitoring", "Terraform", "Python"),
+    "Backend Developer": ("Python", "FastAPI", "Docker", "PostgreSQL", 
+                        "AWS", "Redis", "REST APIs", "Testing"),
+    "AI Researcher": ("Python", "Machine Learning", "Deep Learning", 
+                    "Research", "PyTorch", "Mathematics", "Papers"),
+    "DevOps Engineer": ("Docker", "Kubernetes", "AWS", "CI/CD", 
+                      "Terraform", "Linux", "Networking", "Security")
+})
+
+_ROLE_REQUIRED_SETS: Final[Mapping[str, FrozenSet[str]]] = types.MappingProxyType({
+    role: frozenset(skills) for role, skills in _ROLE_REQUIREMENTS.items()
+})
+
+# Choices offered in the analysis page's skill picker
+_USER_SKILL_OPTIONS: Final[Tuple[str, ...]] = (
+    "Python", "SQL", "Machine Learning", "AWS", "Docker", "JavaScript",
+    "React", "Tableau", "Spark", "Airflow", "Kubernetes", "TensorFlow"
+)
+
+# Skill-specific data (from market analysis)
+_SKILL_DATA: Final[Mapping[str, Mapping[str, int]]] = types.MappingProxyType({
+    "Python": {"hours": 40, "salary_boost": 15000, "demand": 95},
+    "AWS": {"hours": 50, "salary_boost": 18000, "demand": 85},
+    "Docker": {"hours": 25, "salary_boost": 14000, "demand": 75},
+    "Machine Learning": {"hours": 60, "salary_boost": 20000, "demand": 90},
+    "Kubernetes": {"hours": 40, "salary_boost": 17000, "demand": 70},
+    "TensorFlow": {"hours": 45, "salary_boost": 16000, "demand": 65},
+    "Spark": {"hours": 35, "salary_boost": 15000, "demand": 60},
+    "Airflow": {"hours": 30, "salary_boost": 13000, "demand": 55},
+    "FastAPI": {"hours": 35, "salary_boost": 12000, "demand": 50},
+    "React": {"hours": 50, "salary_boost": 11000, "demand": 80},
+    "SQL": {"hours": 30, "salary_boost": 12000, "demand": 98},
+    "JavaScript": {"hours": 60, "salary_boost": 13000, "demand": 95}
+})
+
+# Years of salary uplift counted for each ROI horizon
+_YEARS_MULTIPLIER: Final[Mapping[str, int]] = types.MappingProxyType({
+    "1 year": 1, "3 years": 3, "5 years": 5
+})
+
+# Widget options, shared across reruns instead of rebuilt as literals
+_TARGET_ROLES: Final[Tuple[str, ...]] = tuple(_ROLE_REQUIREMENTS)
+_ROI_TARGET_ROLES: Final[Tuple[str, ...]] = (
+    "Data Scientist", "ML Engineer", "Data Engineer", "Backend Developer", "General"
+)
+_ROI_HORIZONS: Final[Tuple[str, ...]] = tuple(_YEARS_MULTIPLIER)
+_FORECAST_HORIZONS: Final[Tuple[str, ...]] = ("3 months", "6 months", "1 year", "2 years", "5 years")
+
+# Catalogue as parallel arrays for batch ROI scoring
+_SKILL_NAMES: Final[Tuple[str, ...]] = tuple(_SKILL_DATA)
+_SKILL_HOURS_ARR = np.array([d["hours"] for d in _SKILL_DATA.values()], dtype=np.float64)
+_SKILL_BOOST_ARR = np.array([d["salary_boost"] for d in _SKILL_DATA.values()], dtype=np.float64)
+_SKILL_HOURS_ARR.flags.writeable = False
+_SKILL_BOOST_ARR.flags.writeable = False
+_SKILL_NAME_TO_IDX: Final[Mapping[str, int]] = types.MappingProxyType({
+    name: i for i, name in enumerate(_SKILL_NAMES)
+})
+
+def skill_index(name: str) -> int:
+    """Row of a catalogue skill in the parallel skill arrays"""
+    return _SKILL_NAME_TO_IDX[name]
+
+# Sample growth data, one contiguous typed array per column
+_GROWTH_DATA: Final = types.MappingProxyType({
+    "Skill": np.array(["LangChain", "Ray", "Kubernetes", "FastAPI", "MLOps", 
+                       "Python", "Docker", "AWS", "React", "TensorFlow"], dtype=object),
+    "Current Demand": np.array([20, 30, 65, 40, 50, 90, 75, 80, 70, 60], dtype=np.int16),
+    "Future Demand": np.array([65, 55, 80, 65, 75, 92, 85, 88, 78, 65], dtype=np.int16),
+    "Growth %": np.array([225, 83, 23, 63, 50, 2, 13, 10, 11, 8], dtype=np.int16)
+})
+for _arr in _GROWTH_DATA.values():
+    _arr.flags.writeable = False
+
+# Emerging technologies shown on the forecasting page
+_EMERGING_TECH: Final[Tuple[Mapping[str, object], ...]] = (
+    types.MappingProxyType({
+        "name": "LangChain",
+        "current_adoption": 25,
+        "projected_growth": 300,
+        "description": "Framework for developing applications powered by language models",
+        "use_cases": ("AI assistants", "Document analysis", "Automated workflows"),
+        "prerequisites": ("Python", "API knowledge", "Basic ML")
+    }),
+    types.MappingProxyType({
+        "name": "Ray",
+        "current_adoption": 30,
+        "projected_growth": 150,
+        "description": "Distributed computing framework for ML workloads",
+        "use_cases": ("Large-scale ML", "Parallel processing", "Model serving"),
+        "prerequisites": ("Python", "Distributed systems", "ML basics")
+    }),
+    types.MappingProxyType({
+        "name": "MLOps",
+        "current_adoption": 50,
+        "projected_growth": 120,
+        "description": "Practices for deploying and maintaining ML systems",
+        "use_cases": ("Model deployment", "Monitoring", "CI/CD for ML"),
+        "prerequisites": ("Docker", "Kubernetes", "ML experience")
+    }),
+    types.MappingProxyType({
+        "name": "Vector Databases",
+        "current_adoption": 20,
+        "projected_growth": 250,
+        "description": "Databases optimized for similarity search with embeddings",
+        "use_cases": ("AI applications", "Recommendation systems", "Semantic search"),
+        "prerequisites": ("Database knowledge", "ML embeddings", "Python")
+    })
+)
+
+_FEATURE_TEMPLATE = """<div style="text-align: center;">
+    <div style="font-size: 2.5rem;">{icon}</div>
+    <h4>{title}</h4>
+    <p style="font-size: 0.9rem; color: #6b7280;">{description}</p>
+</div>"""
+
+_FEATURES = (
+    {"icon": "📈", "title": "Market Intelligence", "description": "Real-time analysis of job market trends"},
+    {"icon": "🎯", "title": "Skill Gap Analysis", "description": "Identify what skills you need to learn"},
+    {"icon": "💰", "title": "ROI Calculator", "description": "Calculate return on learning investments"},
+    {"icon": "🔮", "title": "Future Forecasting", "description": "Predict skills that will be in demand"},
+)
+
+_SKILL_CARD_TPL = """<div class="skill-card">
+    <div style="display: flex; justify-content: space-between;">
+        <span style="font-weight: 600;">{skill}</span>
+        <span style="color: {color};">{status}</span>
+    </div>
+    <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: #6b7280;">{note}</p>
+</div>"""
+
+_LEARNING_PLAN_TEMPLATE = """
+**Weekly Plan (8 weeks total):**
+
+**Weeks 1-2: Foundations**
+- Complete online course: "Introduction to {skill}"
+- Read documentation and tutorials
+- Build small practice projects
+
+**Weeks 3-4: Practical Application**
+- Work on real-world mini-projects
+- Contribute to open-source projects
+- Join community discussions
+
+**Weeks 5-6: Advanced Concepts**
+- Study advanced topics in {skill}
+- Optimize your code and projects
+- Prepare for technical interviews
+
+**Weeks 7-8: Portfolio Integration**
+- Add {skill} to your resume and LinkedIn
+- Create a portfolio project showcasing {skill}
+- Network with professionals using {skill}
+
+**Time Commitment:** 10 hours/week
+**Resources:** Coursera, edX, official documentation
+"""
+
+# Static page copy, dedented once at import instead of on every render
+_FUTURE_PROOF_MD: Final[str] = textwrap.dedent("""
+    Based on our analysis, here's how to prepare for the future job market:
     
-    /* Subheader */
-    .sub-header {
-        font-size: 1.2rem;
-        color: #6b7280;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
+    1. **Focus on high-growth skills** like LangChain and Vector Databases
+    2. **Build T-shaped expertise** - deep in one area, broad in related areas
+    3. **Learn complementary skill pairs** (e.g., Docker + Kubernetes, Python + FastAPI)
+    4. **Stay adaptable** - technology changes, but fundamental concepts remain
+    5. **Build a learning habit** - dedicate time each week to skill development
     
-    /* Metric cards */
-    .metric-card {
-        background: white;
-        border-radius: 12px;
-        padding: 1.5rem;
-        box-shadow: 0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06);
-        border-left: 5px solid #2563eb;
-        transition: transform 0.3s ease;
-    }
+    ### 📚 Top 3 Skills to Learn Next
     
-    .metric-card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04);
-    }
+    **1. LangChain** - LLM application framework  
+    *Why:* Explosive growth in AI applications (projected +225%)  
+    *Time to learn:* 40 hours  
+    *Salary boost potential:* +$20K  
+    *Resources:* Official docs, YouTube tutorials, GitHub projects
     
-    /* Skill cards */
-    .skill-card {
-        background: linear-gradient(135deg, #f8fafc 0%, #f1f5f9 100%);
-        border-radius: 10px;
-        padding: 1.2rem;
-        margin: 0.75rem 0;
-        border-left: 4px solid #3b82f6;
-        transition: all 0.3s ease;
-    }
+    **2. MLOps** - Machine Learning Operations  
+    *Why:* Critical for production ML systems (+50% growth)  
+    *Time to learn:* 60 hours  
+    *Salary boost potential:* +$25K  
+    *Resources:* Coursera specialization, Medium articles, open-source tools
     
-    .skill-card:hover {
-        background: linear-gradient(135deg, #e0f2fe 0%, #dbeafe 100%);
-        border-left: 4px solid #1d4ed8;
-    }
+    **3. Vector Databases**  
+    *Why:* Foundation for modern AI applications (+250% growth)  
+    *Time to learn:* 35 hours  
+    *Salary boost potential:* +$18K  
+    *Resources:* Pinecone/Weaviate docs, tutorials, sample projects
+    """)
+
+_ABOUT_MD: Final[str] = textwrap.dedent("""
+    ## 🎯 Our Mission
     
-    /* Data source badges */
-    .data-badge {
-        display: inline-block;
-        padding: 0.25rem 0.75rem;
-        border-radius: 20px;
-        font-size: 0.8rem;
-        font-weight: 600;
-        margin: 0.1rem;
-    }
+    Career Compass AI was created to **democratize career planning** by providing 
+    data-driven insights to everyone. We believe that career decisions should 
+    be based on **real market data**, not guesswork or generic advice.
     
-    .badge-real {
-        background: #10b98120;
-        color: #10b981;
-        border: 1px solid #10b98140;
-    }
+    ## 🔬 How It Works
     
-    .badge-sample {
-        background: #f59e0b20;
-        color: #f59e0b;
-        border: 1px solid #f59e0b40;
-    }
+    1. **Data Collection**: We collect job postings from multiple free sources in real-time
+    2. **Skill Extraction**: Advanced analysis extracts skills from job descriptions
+    3. **Market Analysis**: Algorithms identify trends and patterns in the job market
+    4. **Personalization**: Your profile is matched against market demands
+    5. **Recommendations**: AI generates personalized learning paths and career advice
     
-    /* Progress bars */
-    .stProgress > div > div > div > div {
-        background: linear-gradient(90deg, #3b82f6 0%, #8b5cf6 100%);
-    }
+    ## 📊 Data Sources
     
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
+    We use a combination of:
     
-    /* Tabs styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 1rem;
-    }
+    - **Real Public APIs**: Stack Overflow Jobs RSS, GitHub Jobs RSS
+    - **Realistic Market Samples**: Carefully crafted sample data that mimics current trends
+    - **Hybrid Approach**: Real data when available, high-quality samples when not
     
-    .stTabs [data-baseweb="tab"] {
-        border-radius: 8px 8px 0 0;
-        padding: 0.75rem 1.5rem;
-        font-weight: 600;
-    }
+    ## 🛠️ Technology Stack
     
-    .stTabs [aria-selected="true"] {
-        background-color: #2563eb !important;
-        color: white !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+    - **Backend**: Python, Pandas, Scikit-learn
+    - **Data Collection**: BeautifulSoup, Requests, RSS feeds
+    - **Visualization**: Plotly, Streamlit
+    - **Deployment**: Docker, Streamlit Cloud, GitHub Actions
+    
+    ## 🤝 Contributing
+    
+    Career Compass AI is **open source**! We welcome contributions from:
+    
+    - Data scientists and ML engineers
+    - Frontend and backend developers
+    - UX/UI designers
+    - Career coaches and HR professionals
+    
+    Check out our [GitHub repository](https://github.com/chm-hibatallah/career-compass-ai) 
+    for contribution guidelines.
+    
+    ## 📞 Contact & Links
+    
+    - **GitHub**: [github.com/chm-hibatallah/career-compass-ai](https://github.com/chm-hibatallah/career-compass-ai)
+    - **Portfolio**: [Your Portfolio Link]
+    - **LinkedIn**: [Your LinkedIn Profile]
+    
+    ## 📄 License
+    
+    This project is licensed under the **MIT License** - see the [LICENSE](LICENSE) file for details.
+    
+    ## 🙏 Acknowledgments
+    
+    - Built as a portfolio project by [Your Name]
+    - Inspired by the need for data-driven career decisions
+    - Special thanks to all open-source contributors
+    """)
 
-# Initialize session state
-if 'data_loaded' not in st.session_state:
-    st.session_state.data_loaded = False
-if 'jobs_df' not in st.session_state:
-    st.session_state.jobs_df = None
-if 'skill_extractor' not in st.session_state:
-    st.session_state.skill_extractor = SkillExtractor() if DATA_MODULES_AVAILABLE else None
-
-@st.cache_data(show_spinner=True, ttl=3600)  # Cache for 1 hour
-def load_job_data():
-    """Load job data with caching"""
-    if DATA_MODULES_AVAILABLE:
-        collector = FreeJobDataCollector()
-        return collector.collect_all_data(use_cache=True)
-    else:
-        # Return sample data if modules aren't available
-        return pd.DataFrame({
-            'title': ['Data Scientist', 'Machine Learning Engineer', 'Data Analyst'],
-            'company': ['TechCorp', 'DataWorks', 'AnalyticsPro'],
-            'location': ['Remote', 'San Francisco, CA', 'New York, NY'],
-            'source': ['stack_overflow', 'github_jobs', 'reed_uk_sample'],
-            'data_quality': ['real', 'real', 'sample']
-        })
+# Minimum gap between two honoured "Refresh Data" clicks
+_REFRESH_DEBOUNCE_SECONDS: Final = 2.0
+
+# Low-cardinality text columns, stored as categoricals so counts work on codes
+_CATEGORY_COLUMNS = ('source', 'data_quality', 'location', 'company')
+
+@st.cache_resource(show_spinner=True, ttl=3600)  # Cache for 1 hour
+def _load_job_data_shared(_force_refresh: bool = False):
+    """Load job data once and share it across sessions.
+    
+    The frame is returned by reference rather than copied per session, so
+    treat it as read-only and take a .copy() before mutating it.
+    _force_refresh (not part of the cache key) skips the collector's on-disk
+    snapshot and collects afresh.
+    """
+    df = get_collector().collect_all_data(use_cache=not _force_refresh)
+    for col in _CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    # Identifies this load for the aggregation caches below
+    df.attrs['loaded_at'] = datetime.now().timestamp()
+    return df
+
+# Upper bound on bars/slices handed to Plotly for count charts
+_MAX_CHART_CATEGORIES = 20
+
+def _top_counts(counts: pd.Series, limit: int = _MAX_CHART_CATEGORIES) -> pd.Series:
+    """Keep the largest categories of a sorted value_counts and fold the rest into 'Other'"""
+    if len(counts) <= limit:
+        return counts
+    other = pd.Series({"Other": counts.iloc[limit - 1:].sum()})
+    return pd.concat([counts.iloc[:limit - 1], other])
+
+# Hash a jobs frame by load identity and shape instead of its full contents
+_FRAME_HASH_FUNCS = {
+    pd.DataFrame: lambda d: (d.attrs.get('loaded_at'), len(d), tuple(d.columns))
+}
+
+def _n_distinct(col: pd.Series) -> int:
+    """Distinct values; a categorical already knows its categories"""
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        return len(col.cat.categories)
+    return col.nunique()
+
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _job_stats(df: pd.DataFrame) -> types.SimpleNamespace:
+    """Headline counts for a jobs frame; None where the column is missing"""
+    return types.SimpleNamespace(
+        n_jobs=len(df),
+        n_sources=_n_distinct(df['source']) if 'source' in df.columns else None,
+        n_companies=_n_distinct(df['company']) if 'company' in df.columns else None,
+        n_real=int(df['data_quality'].eq('real').sum()) if 'data_quality' in df.columns else None,
+    )
+
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _source_counts(df: pd.DataFrame) -> pd.Series:
+    """Jobs per source, capped for charting"""
+    return _top_counts(df['source'].value_counts())
+
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _top_locations(df: pd.DataFrame, n: int) -> pd.Series:
+    """The n most common job locations"""
+    return df['location'].value_counts(sort=False).nlargest(n)
+
+@st.cache_data(hash_funcs=_FRAME_HASH_FUNCS, show_spinner=False)
+def _top_companies(df: pd.DataFrame, n: int) -> pd.Series:
+    """The n companies with the most postings"""
+    return df['company'].value_counts(sort=False).nlargest(n)
 
 def show_loading_spinner():
     """Show loading animation"""
     with st.spinner("🚀 Loading Career Compass AI..."):
         if not st.session_state.data_loaded:
-            st.session_state.jobs_df = load_job_data()
+            # Set by "Refresh Data" so the reload re-collects instead of reading today's snapshot
+            force_refresh = st.session_state.pop("_force_refresh", False)
+            st.session_state.jobs_df = _load_job_data_shared(_force_refresh=force_refresh)
             st.session_state.data_loaded = True
 
-def create_metric_card(title, value, change=None, icon="📊", color="#2563eb"):
-    """Create a metric card component"""
-    st.markdown(f"""
+_METRIC_CARD_TEMPLATE = string.Template("""
     <div class="metric-card">
         <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
-            <span style="font-size: 1.5rem; margin-right: 0.5rem;">{icon}</span>
-            <span style="font-size: 0.9rem; color: #6b7280; font-weight: 600;">{title}</span>
+            <span style="font-size: 1.5rem; margin-right: 0.5rem;">$icon</span>
+            <span style="font-size: 0.9rem; color: #6b7280; font-weight: 600;">$title</span>
         </div>
-        <div style="font-size: 2rem; font-weight: 800; color: {color}; margin-bottom: 0.25rem;">
-            {value}
-        </div>
-        {f'<div style="font-size: 0.9rem; color: #6b7280;">{change}</div>' if change else ''}
+        <div style="font-size: 2rem; font-weight: 800; color: $color; margin-bottom: 0.25rem;">
+            $value
+        </div>$change
     </div>
-    """, unsafe_allow_html=True)
+    """)
+
+def _metric_card_html(title, value, change=None, icon="📊", color="#2563eb"):
+    """Build the HTML for a metric card"""
+    return _METRIC_CARD_TEMPLATE.substitute(
+        title=title,
+        value=value,
+        change=f'<div style="font-size: 0.9rem; color: #6b7280;">{change}</div>' if change else '',
+        icon=icon,
+        color=color,
+    )
+
+def create_metric_card(title, value, change=None, icon="📊", color="#2563eb"):
+    """Create a metric card component"""
+    st.markdown(_metric_card_html(title, value, change, icon, color), unsafe_allow_html=True)
 
 def show_home_page():
     """Home page with overview"""
@@ -220,7 +524,8 @@ def show_home_page():
         
         """)
         
-        if st.button("🚀 Start Your Analysis", type="primary", use_container_width=True):
+        if st.button("🚀 Start Your Analysis", type="primary", use_container_width=True,
+                     key="home_start_btn"):
             st.session_state.page = "Career Analysis"
             st.rerun()
     
@@ -230,21 +535,27 @@ def show_home_page():
         
         if st.session_state.jobs_df is not None and not st.session_state.jobs_df.empty:
             df = st.session_state.jobs_df
-            total_jobs = len(df)
-            real_data = len(df[df['data_quality'] == 'real']) if 'data_quality' in df.columns else 0
-            companies = df['company'].nunique() if 'company' in df.columns else 0
+            stats = _job_stats(df)
             
-            create_metric_card("Total Jobs", f"{total_jobs:,}", "Updated today")
-            create_metric_card("Real Data", f"{real_data:,} jobs", "From live sources")
-            create_metric_card("Companies", f"{companies:,}", "Actively hiring")
+            # One markdown element for the whole stack instead of one per card
+            cards = "".join([
+                _metric_card_html("Total Jobs", f"{stats.n_jobs:,}", "Updated today"),
+                _metric_card_html("Real Data", f"{stats.n_real or 0:,} jobs", "From live sources"),
+                _metric_card_html("Companies", f"{stats.n_companies or 0:,}", "Actively hiring"),
+            ])
+            st.markdown(f'<div class="card-stack">{cards}</div>', unsafe_allow_html=True)
             
             # Data sources
             st.markdown("### 🔗 Data Sources")
             if 'source' in df.columns:
-                sources = df['source'].value_counts().head(5)
-                for source, count in sources.items():
-                    badge_type = "badge-real" if "sample" not in str(source) else "badge-sample"
-                    st.markdown(f'<span class="data-badge {badge_type}">{source}: {count}</span>', unsafe_allow_html=True)
+                sources = df['source'].value_counts(sort=False).nlargest(5)
+                badge_types = np.where(
+                    sources.index.astype(str).str.contains("sample", regex=False),
+                    "badge-sample", "badge-real"
+                )
+                badges = [f'<span class="data-badge {badge_type}">{source}: {count}</span>'
+                          for source, count, badge_type in zip(sources.index, sources.values, badge_types)]
+                st.markdown(" ".join(badges), unsafe_allow_html=True)
         else:
             st.info("Data loading...")
     
@@ -252,43 +563,82 @@ def show_home_page():
     st.markdown("---")
     st.markdown("## ✨ Key Features")
     
-    features = st.columns(4)
+    features = "".join(_FEATURE_TEMPLATE.format_map(f) for f in _FEATURES)
+    st.markdown(f'<div class="card-row">{features}</div>', unsafe_allow_html=True)
+
+# Market figures are cached on their (label, count) pairs, so tab switches and
+# reruns with unchanged counts skip rebuilding them. st.cache_data returns a
+# copy per call, so no caller shares a mutable Figure with another session.
+@st.cache_data(show_spinner=False)
+def _source_bar_fig(counts: tuple):
+    """Bar chart of jobs per source; sample sources are highlighted"""
+    import plotly.graph_objects as go
+    
+    labels = np.array([label for label, _ in counts], dtype=str)
+    values = [value for _, value in counts]
+    is_sample = np.char.find(labels, 'sample') >= 0
+    fig = go.Figure(data=[
+        go.Bar(
+            x=labels,
+            y=values,
+            marker_color=np.where(is_sample, '#f59e0b', '#3b82f6'),
+            text=values,
+            textposition='auto',
+        )
+    ])
     
-    with features[0]:
-        st.markdown("""
-        <div style="text-align: center;">
-            <div style="font-size: 2.5rem;">📈</div>
-            <h4>Market Intelligence</h4>
-            <p style="font-size: 0.9rem; color: #6b7280;">Real-time analysis of job market trends</p>
-        </div>
-        """, unsafe_allow_html=True)
+    fig.update_layout(
+        xaxis_title="Data Source",
+        yaxis_title="Number of Jobs",
+        template="plotly_white",
+        height=400,
+        uirevision="market_sources"
+    )
     
-    with features[1]:
-        st.markdown("""
-        <div style="text-align: center;">
-            <div style="font-size: 2.5rem;">🎯</div>
-            <h4>Skill Gap Analysis</h4>
-            <p style="font-size: 0.9rem; color: #6b7280;">Identify what skills you need to learn</p>
-        </div>
-        """, unsafe_allow_html=True)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _location_pie_fig(counts: tuple):
+    """Donut chart of the most common job locations"""
+    import plotly.graph_objects as go
     
-    with features[2]:
-        st.markdown("""
-        <div style="text-align: center;">
-            <div style="font-size: 2.5rem;">💰</div>
-            <h4>ROI Calculator</h4>
-            <p style="font-size: 0.9rem; color: #6b7280;">Calculate return on learning investments</p>
-        </div>
-        """, unsafe_allow_html=True)
+    fig = go.Figure(data=[go.Pie(
+        labels=[label for label, _ in counts],
+        values=[value for _, value in counts],
+        hole=0.3,
+        marker_colors=['#3b82f6', '#8b5cf6', '#10b981', '#f59e0b', '#ef4444']
+    )])
     
-    with features[3]:
-        st.markdown("""
-        <div style="text-align: center;">
-            <div style="font-size: 2.5rem;">🔮</div>
-            <h4>Future Forecasting</h4>
-            <p style="font-size: 0.9rem; color: #6b7280;">Predict skills that will be in demand</p>
-        </div>
-        """, unsafe_allow_html=True)
+    fig.update_layout(height=500)
+    
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _company_bar_fig(counts: tuple):
+    """Horizontal bar chart of the top hiring companies"""
+    import plotly.graph_objects as go
+    
+    values = [value for _, value in counts]
+    fig = go.Figure(data=[
+        go.Bar(
+            x=values,
+            y=[label for label, _ in counts],
+            orientation='h',
+            marker_color='#10b981',
+            text=values,
+            textposition='auto',
+        )
+    ])
+    
+    fig.update_layout(
+        xaxis_title="Number of Job Postings",
+        yaxis_title="Company",
+        template="plotly_white",
+        height=500,
+        uirevision="market_companies"
+    )
+    
+    return fig
 
 def show_market_page():
     """Market overview page"""
@@ -296,31 +646,21 @@ def show_market_page():
     
     if st.session_state.jobs_df is None or st.session_state.jobs_df.empty:
         st.warning("No job data available. Loading sample data...")
-        st.session_state.jobs_df = load_job_data()
+        st.session_state.jobs_df = _load_job_data_shared()
     
     df = st.session_state.jobs_df
-    
-    # Top metrics
-    cols = st.columns(4)
-    
-    with cols[0]:
-        total_jobs = len(df)
-        create_metric_card("Total Jobs", f"{total_jobs:,}", icon="📈")
-    
-    with cols[1]:
-        if 'source' in df.columns:
-            unique_sources = df['source'].nunique()
-            create_metric_card("Data Sources", unique_sources, icon="🔗")
-    
-    with cols[2]:
-        if 'company' in df.columns:
-            unique_companies = df['company'].nunique()
-            create_metric_card("Companies", unique_companies, icon="🏢")
-    
-    with cols[3]:
-        if 'data_quality' in df.columns:
-            real_data = len(df[df['data_quality'] == 'real'])
-            create_metric_card("Real Data", f"{real_data:,}", icon="✅")
+    stats = _job_stats(df)
+    
+    # Top metrics, rendered as one flex row
+    total_jobs = stats.n_jobs
+    cards = [_metric_card_html("Total Jobs", f"{total_jobs:,}", icon="📈")]
+    if stats.n_sources is not None:
+        cards.append(_metric_card_html("Data Sources", stats.n_sources, icon="🔗"))
+    if stats.n_companies is not None:
+        cards.append(_metric_card_html("Companies", stats.n_companies, icon="🏢"))
+    if stats.n_real is not None:
+        cards.append(_metric_card_html("Real Data", f"{stats.n_real:,}", icon="✅"))
+    st.markdown(f'<div class="card-row">{"".join(cards)}</div>', unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -331,55 +671,35 @@ def show_market_page():
         st.subheader("Job Distribution by Source")
         
         if 'source' in df.columns:
-            source_counts = df['source'].value_counts()
+            source_counts = _source_counts(df)
             
-            # Create bar chart
-            fig = go.Figure(data=[
-                go.Bar(
-                    x=source_counts.index,
-                    y=source_counts.values,
-                    marker_color=['#3b82f6' if 'sample' not in str(x) else '#f59e0b' for x in source_counts.index],
-                    text=source_counts.values,
-                    textposition='auto',
-                )
-            ])
-            
-            fig.update_layout(
-                xaxis_title="Data Source",
-                yaxis_title="Number of Jobs",
-                template="plotly_white",
-                height=400
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            fig = _source_bar_fig(tuple(source_counts.items()))
+            st.plotly_chart(fig, use_container_width=True, key="market_sources_chart")
             
             # Source details
             st.markdown("#### Source Details")
-            for source, count in source_counts.items():
-                col1, col2 = st.columns([1, 3])
-                with col1:
-                    st.markdown(f"**{source}**")
-                with col2:
-                    st.progress(count / total_jobs, text=f"{count} jobs ({count/total_jobs*100:.1f}%)")
+            details = source_counts.rename_axis("Source").rename("Jobs").to_frame()
+            details["Share"] = details["Jobs"] / total_jobs * 100
+            st.dataframe(
+                details,
+                use_container_width=True,
+                column_config={
+                    "Share": st.column_config.ProgressColumn(
+                        "Share", format="%.1f%%", min_value=0, max_value=100
+                    ),
+                },
+            )
     
     with tab2:
         st.subheader("Geographic Distribution")
         
         if 'location' in df.columns:
             # Clean location data
-            locations = df['location'].value_counts().head(10)
+            locations = _top_locations(df, 10)
             
             if not locations.empty:
-                # Create pie chart
-                fig = go.Figure(data=[go.Pie(
-                    labels=locations.index,
-                    values=locations.values,
-                    hole=0.3,
-                    marker_colors=['#3b82f6', '#8b5cf6', '#10b981', '#f59e0b', '#ef4444']
-                )])
-                
-                fig.update_layout(height=500)
-                st.plotly_chart(fig, use_container_width=True)
+                fig = _location_pie_fig(tuple(locations.items()))
+                st.plotly_chart(fig, use_container_width=True, key="market_locations_chart")
             else:
                 st.info("No location data available")
     
@@ -387,28 +707,35 @@ def show_market_page():
         st.subheader("Top Hiring Companies")
         
         if 'company' in df.columns:
-            company_counts = df['company'].value_counts().head(15)
-            
-            fig = go.Figure(data=[
-                go.Bar(
-                    x=company_counts.values,
-                    y=company_counts.index,
-                    orientation='h',
-                    marker_color='#10b981',
-                    text=company_counts.values,
-                    textposition='auto',
-                )
-            ])
+            company_counts = _top_companies(df, 15)
             
-            fig.update_layout(
-                xaxis_title="Number of Job Postings",
-                yaxis_title="Company",
-                template="plotly_white",
-                height=500
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+            fig = _company_bar_fig(tuple(company_counts.items()))
+            st.plotly_chart(fig, use_container_width=True, key="market_companies_chart")
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _analysis_metrics(user_skills_key: tuple, target_role: str) -> dict:
+    """Derive gaps, strengths and summary figures for a skills/role pair"""
+    required_skills = _ROLE_REQUIREMENTS.get(target_role, ())
+    required_set = _ROLE_REQUIRED_SETS.get(target_role, frozenset())
+    current_set = frozenset(user_skills_key)
+    strength_set = required_set & current_set
+    gap_set = required_set - current_set
+    # Keep the role's display order
+    gaps = [skill for skill in required_skills if skill in gap_set]
+    strengths = [skill for skill in required_skills if skill in strength_set]
+    
+    return {
+        'coverage': len(strengths) / len(required_skills) * 100 if required_skills else 0,
+        'gaps': gaps,
+        'strengths': strengths,
+        # Estimated timeline (1.5 months per skill)
+        'months': len(gaps) * 1.5,
+        # Salary impact (simulated)
+        'salary_boost': 15000 + (len(strengths) * 2000),
+    }
 
+# Interactive pages are fragments, so their widgets rerun only the page body
+@compat_fragment
 def show_analysis_page():
     """Career analysis page"""
     st.header("🎯 Personalized Career Analysis")
@@ -420,50 +747,35 @@ def show_analysis_page():
         st.subheader("Your Profile")
         current_skills = st.multiselect(
             "Your Current Skills",
-            ["Python", "SQL", "Machine Learning", "AWS", "Docker", "JavaScript", 
-             "React", "Tableau", "Spark", "Airflow", "Kubernetes", "TensorFlow"],
-            default=["Python", "SQL"]
+            _USER_SKILL_OPTIONS,
+            default=["Python", "SQL"],
+            key="user_skills"
         )
         
-        experience_years = st.slider("Years of Experience", 0, 20, 3)
+        experience_years = st.slider("Years of Experience", 0, 20, 3, key="experience")
     
     with col2:
         st.subheader("Target Role")
         target_role = st.selectbox(
             "Select Your Target Role",
-            ["Data Scientist", "Machine Learning Engineer", "Data Engineer", 
-             "MLOps Engineer", "Backend Developer", "AI Researcher", "DevOps Engineer"]
+            _TARGET_ROLES,
+            key="target_role"
         )
         
-        timeline_months = st.slider("Target Timeline (months)", 3, 24, 12)
+        timeline_months = st.slider("Target Timeline (months)", 3, 24, 12, key="timeline_months")
     
     # Analyze button
-    if st.button("🔍 Analyze My Career Path", type="primary", use_container_width=True):
+    if st.button("🔍 Analyze My Career Path", type="primary", use_container_width=True,
+                 key="analyze_btn"):
         with st.spinner("Analyzing your career path..."):
-            # Skill requirements by role (this would come from your ML model)
-            role_requirements = {
-                "Data Scientist": ["Python", "SQL", "Machine Learning", "Statistics", 
-                                 "Data Visualization", "A/B Testing", "Communication"],
-                "Machine Learning Engineer": ["Python", "Docker", "AWS", "MLOps", 
-                                            "TensorFlow", "CI/CD", "Kubernetes", "System Design"],
-                "Data Engineer": ["SQL", "Python", "Spark", "AWS", "Airflow", 
-                                "Kafka", "Data Pipelines", "Data Warehousing"],
-                "MLOps Engineer": ["Docker", "Kubernetes", "AWS", "MLOps", 
-                                 "CI/CD", "Monitoring", "Terraform", "Python"],
-                "Backend Developer": ["Python", "FastAPI", "Docker", "PostgreSQL", 
-                                    "AWS", "Redis", "REST APIs", "Testing"],
-                "AI Researcher": ["Python", "Machine Learning", "Deep Learning", 
-                                "Research", "PyTorch", "Mathematics", "Papers"],
-                "DevOps Engineer": ["Docker", "Kubernetes", "AWS", "CI/CD", 
-                                  "Terraform", "Linux", "Networking", "Security"]
-            }
-            
-            required_skills = role_requirements.get(target_role, [])
+            required_skills = _ROLE_REQUIREMENTS.get(target_role, ())
             
             # Calculate gaps
             if required_skills:
-                gaps = [skill for skill in required_skills if skill not in current_skills]
-                strengths = [skill for skill in current_skills if skill in required_skills]
+                # Sorted so the cache key doesn't depend on multiselect order
+                metrics = _analysis_metrics(tuple(sorted(current_skills)), target_role)
+                gaps = metrics['gaps']
+                strengths = metrics['strengths']
                 
                 # Display results
                 col1, col2 = st.columns(2)
@@ -471,36 +783,22 @@ def show_analysis_page():
                 with col1:
                     st.subheader("✅ Your Strengths")
                     if strengths:
-                        for skill in strengths:
-                            st.markdown(f"""
-                            <div class="skill-card">
-                                <div style="display: flex; justify-content: space-between;">
-                                    <span style="font-weight: 600;">{skill}</span>
-                                    <span style="color: #10b981;">✓ Mastered</span>
-                                </div>
-                                <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: #6b7280;">
-                                Already aligns with {target_role} requirements
-                                </p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                        note = f"Already aligns with {target_role} requirements"
+                        cards = "".join(_SKILL_CARD_TPL.format(
+                            skill=skill, color="#10b981", status="✓ Mastered", note=note
+                        ) for skill in strengths)
+                        st.markdown(cards, unsafe_allow_html=True)
                     else:
                         st.info("No matching skills yet. Time to start learning!")
                 
                 with col2:
                     st.subheader("📚 Skills to Learn")
                     if gaps:
-                        for skill in gaps[:5]:  # Show top 5
-                            st.markdown(f"""
-                            <div class="skill-card">
-                                <div style="display: flex; justify-content: space-between;">
-                                    <span style="font-weight: 600;">{skill}</span>
-                                    <span style="color: #3b82f6;">🔧 Required</span>
-                                </div>
-                                <p style="margin: 0.5rem 0 0 0; font-size: 0.9rem; color: #6b7280;">
-                                Critical for {target_role} • ~40 hours to proficiency
-                                </p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                        note = f"Critical for {target_role} • ~40 hours to proficiency"
+                        cards = "".join(_SKILL_CARD_TPL.format(
+                            skill=skill, color="#3b82f6", status="🔧 Required", note=note
+                        ) for skill in gaps[:5])  # Show top 5
+                        st.markdown(cards, unsafe_allow_html=True)
                     else:
                         st.success("🎉 You have all required skills for this role!")
                 
@@ -508,24 +806,13 @@ def show_analysis_page():
                 st.markdown("---")
                 st.subheader("📊 Analysis Summary")
                 
-                cols = st.columns(4)
-                
-                with cols[0]:
-                    coverage = len(strengths) / len(required_skills) * 100 if required_skills else 0
-                    create_metric_card("Skill Coverage", f"{coverage:.1f}%", icon="✅")
-                
-                with cols[1]:
-                    create_metric_card("Skills to Learn", len(gaps), icon="📚")
-                
-                with cols[2]:
-                    # Estimated timeline (1.5 months per skill)
-                    months = len(gaps) * 1.5
-                    create_metric_card("Est. Timeline", f"{months:.1f} months", icon="⏱️")
-                
-                with cols[3]:
-                    # Salary impact (simulated)
-                    salary_boost = 15000 + (len(strengths) * 2000)
-                    create_metric_card("Salary Potential", f"+${salary_boost:,}", icon="💰")
+                cards = "".join([
+                    _metric_card_html("Skill Coverage", f"{metrics['coverage']:.1f}%", icon="✅"),
+                    _metric_card_html("Skills to Learn", len(gaps), icon="📚"),
+                    _metric_card_html("Est. Timeline", f"{metrics['months']:.1f} months", icon="⏱️"),
+                    _metric_card_html("Salary Potential", f"+${metrics['salary_boost']:,}", icon="💰"),
+                ])
+                st.markdown(f'<div class="card-row">{cards}</div>', unsafe_allow_html=True)
                 
                 # Learning roadmap
                 if gaps:
@@ -534,32 +821,7 @@ def show_analysis_page():
                     
                     for i, skill in enumerate(gaps[:4], 1):
                         with st.expander(f"Phase {i}: Master {skill}"):
-                            st.markdown(f"""
-                            **Weekly Plan (8 weeks total):**
-                            
-                            **Weeks 1-2: Foundations**
-                            - Complete online course: "Introduction to {skill}"
-                            - Read documentation and tutorials
-                            - Build small practice projects
-                            
-                            **Weeks 3-4: Practical Application**
-                            - Work on real-world mini-projects
-                            - Contribute to open-source projects
-                            - Join community discussions
-                            
-                            **Weeks 5-6: Advanced Concepts**
-                            - Study advanced topics in {skill}
-                            - Optimize your code and projects
-                            - Prepare for technical interviews
-                            
-                            **Weeks 7-8: Portfolio Integration**
-                            - Add {skill} to your resume and LinkedIn
-                            - Create a portfolio project showcasing {skill}
-                            - Network with professionals using {skill}
-                            
-                            **Time Commitment:** 10 hours/week
-                            **Resources:** Coursera, edX, official documentation
-                            """)
+                            st.markdown(_LEARNING_PLAN_TEMPLATE.format(skill=skill))
                 
                 # Recommendations
                 st.markdown("---")
@@ -573,13 +835,77 @@ def show_analysis_page():
                     "Prepare for technical interviews with LeetCode problems"
                 ]
                 
-                for i, rec in enumerate(recommendations, 1):
-                    st.markdown(f"{i}. {rec}")
+                st.markdown("\n".join(f"{i}. {rec}" for i, rec in enumerate(recommendations, 1)))
     
     else:
         # Show placeholder before analysis
         st.info("👆 Click 'Analyze My Career Path' to see personalized recommendations")
 
+def _roi_kernel(hours_arr, boost_arr, hours_per_week, course_cost, weekly_cost, return_factor):
+    """Score any number of skills at once from their hours and salary boosts.
+    
+    Returns (weeks, investment, return, ratio, score, payback months) arrays.
+    """
+    weeks = hours_arr / hours_per_week
+    invest = course_cost + weeks * weekly_cost
+    total_return = boost_arr * return_factor
+    # Divide by a safe denominator so neither path warns on zero
+    ratio = np.where(invest > 0, total_return / np.where(invest > 0, invest, 1.0), 0.0)
+    score = np.minimum(100.0, ratio * 15)  # Scale to 0-100
+    payback = np.where(boost_arr > 0, invest / (np.where(boost_arr > 0, boost_arr, 1.0) / 12), 999.0)
+    return weeks, invest, total_return, ratio, score, payback
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _compute_roi(skill, hours_per_week, course_cost, weekly_opportunity_cost,
+                 time_horizon, confidence):
+    """Compute ROI metrics for learning a skill"""
+    if skill in _SKILL_NAME_TO_IDX:
+        i = skill_index(skill)
+        hours, boost = _SKILL_HOURS_ARR[i:i + 1], _SKILL_BOOST_ARR[i:i + 1]
+    else:
+        hours, boost = np.array([40.0]), np.array([10000.0])
+    
+    # ROI based on time horizon
+    years_multiplier = _YEARS_MULTIPLIER[time_horizon]
+    return_factor = years_multiplier * (confidence / 100)
+    
+    weeks, invest, total_return, ratio, score, payback = _roi_kernel(
+        hours, boost,
+        float(hours_per_week), float(course_cost), float(weekly_opportunity_cost), return_factor
+    )
+    weeks_to_learn = float(weeks[0])
+    
+    return {
+        "weeks_to_learn": weeks_to_learn,
+        "months_to_learn": weeks_to_learn / 4.33,
+        "learning_cost": course_cost,
+        "opportunity_cost": weeks_to_learn * weekly_opportunity_cost,
+        "total_investment": float(invest[0]),
+        "total_return": float(total_return[0]),
+        "roi_ratio": float(ratio[0]),
+        "roi_score": float(score[0]),
+        "payback_months": float(payback[0]),
+    }
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _catalogue_roi(hours_per_week, course_cost, weekly_opportunity_cost,
+                   time_horizon, confidence) -> pd.DataFrame:
+    """Score the whole skill catalogue in one pass, best ROI first"""
+    years_multiplier = _YEARS_MULTIPLIER[time_horizon]
+    weeks, invest, _, ratio, score, _ = _roi_kernel(
+        _SKILL_HOURS_ARR, _SKILL_BOOST_ARR, float(hours_per_week), float(course_cost),
+        float(weekly_opportunity_cost), years_multiplier * (confidence / 100)
+    )
+    return pd.DataFrame({
+        "Skill": _SKILL_NAMES,
+        "Weeks": weeks,
+        "Salary Boost": _SKILL_BOOST_ARR,
+        "Investment": invest,
+        "ROI Ratio": ratio,
+        "ROI Score": score,
+    }).sort_values("ROI Ratio", ascending=False, ignore_index=True)
+
+@compat_fragment
 def show_roi_page():
     """ROI Calculator page"""
     st.header("💰 ROI Calculator")
@@ -595,71 +921,56 @@ def show_roi_page():
     with col1:
         skill = st.selectbox(
             "Select skill to evaluate",
-            ["Python", "AWS", "Docker", "Machine Learning", "Kubernetes", 
-             "TensorFlow", "Spark", "Airflow", "FastAPI", "React", "SQL", "JavaScript"]
+            _SKILL_NAMES,
+            key="roi_skill"
         )
         
         hours_per_week = st.slider("Hours per week for learning", 5, 40, 10, 
-                                 help="How many hours can you dedicate per week?")
+                                 help="How many hours can you dedicate per week?",
+                                 key="roi_hours_per_week")
     
     with col2:
         current_salary = st.number_input("Current annual salary ($)", 
                                        50000, 300000, 80000, step=5000,
-                                       help="Your current or expected starting salary")
+                                       help="Your current or expected starting salary",
+                                       key="roi_current_salary")
         
         target_role = st.selectbox(
             "Target role for this skill",
-            ["Data Scientist", "ML Engineer", "Data Engineer", "Backend Developer", "General"]
+            _ROI_TARGET_ROLES,
+            key="roi_target_role"
         )
     
     # Calculation parameters
     with st.expander("⚙️ Advanced Settings"):
         col1, col2 = st.columns(2)
         with col1:
-            course_cost = st.number_input("Estimated course cost ($)", 0, 5000, 100)
-            weekly_opportunity_cost = st.number_input("Opportunity cost per week ($)", 0, 1000, 100)
+            course_cost = st.number_input("Estimated course cost ($)", 0, 5000, 100,
+                                          key="roi_course_cost")
+            weekly_opportunity_cost = st.number_input("Opportunity cost per week ($)", 0, 1000, 100,
+                                                      key="roi_opportunity_cost")
         with col2:
-            time_horizon = st.selectbox("ROI time horizon", ["1 year", "3 years", "5 years"], index=1)
-            confidence = st.slider("Market confidence", 50, 100, 80)
+            time_horizon = st.selectbox("ROI time horizon", _ROI_HORIZONS, index=1,
+                                        key="roi_time_horizon")
+            confidence = st.slider("Market confidence", 50, 100, 80, key="roi_confidence")
+            show_max_roi = st.checkbox("Compare ROI across all skills", key="roi_show_max")
     
     # Calculate ROI
-    if st.button("📊 Calculate ROI", type="primary", use_container_width=True):
-        
-        # Skill-specific data (from market analysis)
-        skill_data = {
-            "Python": {"hours": 40, "salary_boost": 15000, "demand": 95},
-            "AWS": {"hours": 50, "salary_boost": 18000, "demand": 85},
-            "Docker": {"hours": 25, "salary_boost": 14000, "demand": 75},
-            "Machine Learning": {"hours": 60, "salary_boost": 20000, "demand": 90},
-            "Kubernetes": {"hours": 40, "salary_boost": 17000, "demand": 70},
-            "TensorFlow": {"hours": 45, "salary_boost": 16000, "demand": 65},
-            "Spark": {"hours": 35, "salary_boost": 15000, "demand": 60},
-            "Airflow": {"hours": 30, "salary_boost": 13000, "demand": 55},
-            "FastAPI": {"hours": 35, "salary_boost": 12000, "demand": 50},
-            "React": {"hours": 50, "salary_boost": 11000, "demand": 80},
-            "SQL": {"hours": 30, "salary_boost": 12000, "demand": 98},
-            "JavaScript": {"hours": 60, "salary_boost": 13000, "demand": 95}
-        }
-        
-        data = skill_data.get(skill, {"hours": 40, "salary_boost": 10000, "demand": 50})
-        
-        # Calculations
-        weeks_to_learn = data["hours"] / hours_per_week
-        months_to_learn = weeks_to_learn / 4.33
-        
-        # Investment costs
-        learning_cost = course_cost
-        opportunity_cost = weeks_to_learn * weekly_opportunity_cost
-        total_investment = learning_cost + opportunity_cost
-        
-        # ROI based on time horizon
-        years_multiplier = {"1 year": 1, "3 years": 3, "5 years": 5}[time_horizon]
-        total_return = data["salary_boost"] * years_multiplier * (confidence / 100)
+    if st.button("📊 Calculate ROI", type="primary", use_container_width=True,
+                 key="roi_calculate_btn"):
         
-        # ROI metrics
-        roi_ratio = total_return / total_investment if total_investment > 0 else 0
-        roi_score = min(100, roi_ratio * 15)  # Scale to 0-100
-        payback_months = total_investment / (data["salary_boost"] / 12) if data["salary_boost"] > 0 else 999
+        data = _SKILL_DATA.get(skill, {"hours": 40, "salary_boost": 10000, "demand": 50})
+        roi = _compute_roi(skill, hours_per_week, course_cost, weekly_opportunity_cost,
+                           time_horizon, confidence)
+        weeks_to_learn = roi["weeks_to_learn"]
+        months_to_learn = roi["months_to_learn"]
+        learning_cost = roi["learning_cost"]
+        opportunity_cost = roi["opportunity_cost"]
+        total_investment = roi["total_investment"]
+        total_return = roi["total_return"]
+        roi_ratio = roi["roi_ratio"]
+        roi_score = roi["roi_score"]
+        payback_months = roi["payback_months"]
         
         # Display results
         st.success(f"## 📈 ROI Analysis for **{skill}**")
@@ -748,7 +1059,95 @@ def show_roi_page():
             - Only learn if specifically required for your target role
             - Look for free resources to reduce investment
             """)
+        
+        if show_max_roi:
+            catalogue = _catalogue_roi(hours_per_week, course_cost, weekly_opportunity_cost,
+                                       time_horizon, confidence)
+            best = catalogue.iloc[0]
+            st.info(f"💡 Highest ROI across all skills with these settings: "
+                    f"**{best['Skill']}** ({best['ROI Score']:.1f}/100, {best['ROI Ratio']:.1f}x)")
+            st.dataframe(
+                catalogue,
+                hide_index=True,
+                use_container_width=True,
+                column_config={
+                    "Weeks": st.column_config.NumberColumn(format="%.1f"),
+                    "Salary Boost": st.column_config.NumberColumn(format="$%d"),
+                    "Investment": st.column_config.NumberColumn(format="$%.0f"),
+                    "ROI Ratio": st.column_config.NumberColumn(format="%.1fx"),
+                    "ROI Score": st.column_config.NumberColumn(format="%.1f"),
+                },
+            )
+
+@st.cache_data(show_spinner=False)
+def _forecast_fig(horizon):
+    """Build the skill demand projection chart for a forecast horizon"""
+    import plotly.graph_objects as go
+    
+    skills = _GROWTH_DATA["Skill"]
+    
+    # Create comparison chart straight from the column arrays
+    fig = go.Figure(data=[
+        go.Bar(name='Current Demand', x=skills, y=_GROWTH_DATA["Current Demand"],
+               marker_color='#3b82f6'),
+        go.Bar(name=f'Future Demand ({horizon})', x=skills, y=_GROWTH_DATA["Future Demand"],
+               marker_color='#8b5cf6')
+    ])
+    
+    fig.update_layout(
+        title=f"Skill Demand Growth Projection ({horizon})",
+        barmode='group',
+        xaxis_title="Skill",
+        yaxis_title="Demand Score (0-100)",
+        template="plotly_white",
+        height=500,
+        # Keep zoom/legend state when the horizon slider reruns the page
+        uirevision="forecast"
+    )
+    
+    return fig
+
+@st.cache_resource
+def _emerging_tech_df() -> pd.DataFrame:
+    """Emerging technologies as one table, built once and shared read-only"""
+    return pd.DataFrame({
+        "Technology": [t["name"] for t in _EMERGING_TECH],
+        "Adoption": [t["current_adoption"] for t in _EMERGING_TECH],
+        "Projected Growth": [t["projected_growth"] for t in _EMERGING_TECH],
+        "Description": [t["description"] for t in _EMERGING_TECH],
+        "Key Use Cases": [", ".join(t["use_cases"]) for t in _EMERGING_TECH],
+        "Prerequisites": [", ".join(t["prerequisites"]) for t in _EMERGING_TECH],
+    })
+
+@st.cache_data(show_spinner=False)
+def _adoption_gauges_fig():
+    """One figure holding a current-adoption gauge per emerging technology"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    fig = make_subplots(rows=1, cols=len(_EMERGING_TECH),
+                        specs=[[{'type': 'indicator'}] * len(_EMERGING_TECH)])
+    for col, tech in enumerate(_EMERGING_TECH, 1):
+        fig.add_trace(go.Indicator(
+            mode="gauge+number",
+            value=tech["current_adoption"],
+            title={'text': tech["name"]},
+            gauge={
+                'axis': {'range': [None, 100]},
+                'bar': {'color': "#8b5cf6"},
+                'steps': [
+                    {'range': [0, 30], 'color': "lightgray"},
+                    {'range': [30, 70], 'color': "gray"},
+                    {'range': [70, 100], 'color': "darkgray"}
+                ]
+            }
+        ), row=1, col=col)
+    
+    fig.update_layout(height=250, margin=dict(l=30, r=30, t=60, b=20))
+    
+    return fig
 
+@compat_fragment
 def show_forecasting_page():
     """Future forecasting page"""
     st.header("🔮 Future Skill Forecasting")
@@ -761,209 +1160,82 @@ def show_forecasting_page():
     # Time horizon selection
     horizon = st.select_slider(
         "Forecast Horizon",
-        options=["3 months", "6 months", "1 year", "2 years", "5 years"],
-        value="1 year"
+        options=_FORECAST_HORIZONS,
+        value="1 year",
+        key="forecast_horizon"
     )
     
     # Emerging technologies
     st.subheader("🚀 Emerging Technologies")
     
-    emerging_tech = [
-        {
-            "name": "LangChain",
-            "current_adoption": 25,
-            "projected_growth": 300,
-            "description": "Framework for developing applications powered by language models",
-            "use_cases": ["AI assistants", "Document analysis", "Automated workflows"],
-            "prerequisites": ["Python", "API knowledge", "Basic ML"]
+    # One table and one gauge figure instead of an expander per technology
+    st.dataframe(
+        _emerging_tech_df(),
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "Adoption": st.column_config.ProgressColumn(
+                "Current Adoption", format="%d%%", min_value=0, max_value=100
+            ),
+            "Projected Growth": st.column_config.NumberColumn(format="+%d%%"),
         },
-        {
-            "name": "Ray",
-            "current_adoption": 30,
-            "projected_growth": 150,
-            "description": "Distributed computing framework for ML workloads",
-            "use_cases": ["Large-scale ML", "Parallel processing", "Model serving"],
-            "prerequisites": ["Python", "Distributed systems", "ML basics"]
-        },
-        {
-            "name": "MLOps",
-            "current_adoption": 50,
-            "projected_growth": 120,
-            "description": "Practices for deploying and maintaining ML systems",
-            "use_cases": ["Model deployment", "Monitoring", "CI/CD for ML"],
-            "prerequisites": ["Docker", "Kubernetes", "ML experience"]
-        },
-        {
-            "name": "Vector Databases",
-            "current_adoption": 20,
-            "projected_growth": 250,
-            "description": "Databases optimized for similarity search with embeddings",
-            "use_cases": ["AI applications", "Recommendation systems", "Semantic search"],
-            "prerequisites": ["Database knowledge", "ML embeddings", "Python"]
-        }
-    ]
-    
-    for tech in emerging_tech:
-        with st.expander(f"{tech['name']} - Projected growth: +{tech['projected_growth']}%"):
-            col1, col2 = st.columns([3, 1])
-            
-            with col1:
-                st.markdown(f"**Description:** {tech['description']}")
-                st.markdown(f"**Key Use Cases:** {', '.join(tech['use_cases'])}")
-                st.markdown(f"**Prerequisites:** {', '.join(tech['prerequisites'])}")
-            
-            with col2:
-                # Growth gauge
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=tech['current_adoption'],
-                    title={'text': "Current Adoption"},
-                    domain={'x': [0, 1], 'y': [0, 1]},
-                    gauge={
-                        'axis': {'range': [None, 100]},
-                        'bar': {'color': "#8b5cf6"},
-                        'steps': [
-                            {'range': [0, 30], 'color': "lightgray"},
-                            {'range': [30, 70], 'color': "gray"},
-                            {'range': [70, 100], 'color': "darkgray"}
-                        ]
-                    }
-                ))
-                
-                fig.update_layout(height=200, margin=dict(l=20, r=20, t=50, b=20))
-                st.plotly_chart(fig, use_container_width=True)
+    )
+    st.plotly_chart(_adoption_gauges_fig(), use_container_width=True, key="adoption_gauges")
     
     # Skill growth predictions
     st.markdown("---")
     st.subheader("📈 Skill Growth Predictions")
     
-    # Sample growth data
-    growth_data = {
-        "Skill": ["LangChain", "Ray", "Kubernetes", "FastAPI", "MLOps", 
-                 "Python", "Docker", "AWS", "React", "TensorFlow"],
-        "Current Demand": [20, 30, 65, 40, 50, 90, 75, 80, 70, 60],
-        "Future Demand": [65, 55, 80, 65, 75, 92, 85, 88, 78, 65],
-        "Growth %": [225, 83, 23, 63, 50, 2, 13, 10, 11, 8]
-    }
-    
-    # Create comparison chart
-    fig = go.Figure(data=[
-        go.Bar(name='Current Demand', x=growth_data["Skill"], y=growth_data["Current Demand"],
-               marker_color='#3b82f6'),
-        go.Bar(name=f'Future Demand ({horizon})', x=growth_data["Skill"], y=growth_data["Future Demand"],
-               marker_color='#8b5cf6')
-    ])
-    
-    fig.update_layout(
-        title=f"Skill Demand Growth Projection ({horizon})",
-        barmode='group',
-        xaxis_title="Skill",
-        yaxis_title="Demand Score (0-100)",
-        template="plotly_white",
-        height=500
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(_forecast_fig(horizon), use_container_width=True, key="forecast_chart")
     
     # Recommendations
     st.markdown("---")
     st.subheader("🎯 Future-Proof Your Career")
     
-    st.markdown("""
-    Based on our analysis, here's how to prepare for the future job market:
-    
-    1. **Focus on high-growth skills** like LangChain and Vector Databases
-    2. **Build T-shaped expertise** - deep in one area, broad in related areas
-    3. **Learn complementary skill pairs** (e.g., Docker + Kubernetes, Python + FastAPI)
-    4. **Stay adaptable** - technology changes, but fundamental concepts remain
-    5. **Build a learning habit** - dedicate time each week to skill development
-    
-    ### 📚 Top 3 Skills to Learn Next
-    
-    **1. LangChain** - LLM application framework  
-    *Why:* Explosive growth in AI applications (projected +225%)  
-    *Time to learn:* 40 hours  
-    *Salary boost potential:* +$20K  
-    *Resources:* Official docs, YouTube tutorials, GitHub projects
-    
-    **2. MLOps** - Machine Learning Operations  
-    *Why:* Critical for production ML systems (+50% growth)  
-    *Time to learn:* 60 hours  
-    *Salary boost potential:* +$25K  
-    *Resources:* Coursera specialization, Medium articles, open-source tools
-    
-    **3. Vector Databases**  
-    *Why:* Foundation for modern AI applications (+250% growth)  
-    *Time to learn:* 35 hours  
-    *Salary boost potential:* +$18K  
-    *Resources:* Pinecone/Weaviate docs, tutorials, sample projects
-    """)
+    st.markdown(_FUTURE_PROOF_MD)
 
 def show_about_page():
     """About page"""
     st.header("About Career Compass AI")
     
-    st.markdown("""
-    ## 🎯 Our Mission
-    
-    Career Compass AI was created to **democratize career planning** by providing 
-    data-driven insights to everyone. We believe that career decisions should 
-    be based on **real market data**, not guesswork or generic advice.
-    
-    ## 🔬 How It Works
-    
-    1. **Data Collection**: We collect job postings from multiple free sources in real-time
-    2. **Skill Extraction**: Advanced analysis extracts skills from job descriptions
-    3. **Market Analysis**: Algorithms identify trends and patterns in the job market
-    4. **Personalization**: Your profile is matched against market demands
-    5. **Recommendations**: AI generates personalized learning paths and career advice
-    
-    ## 📊 Data Sources
-    
-    We use a combination of:
-    
-    - **Real Public APIs**: Stack Overflow Jobs RSS, GitHub Jobs RSS
-    - **Realistic Market Samples**: Carefully crafted sample data that mimics current trends
-    - **Hybrid Approach**: Real data when available, high-quality samples when not
-    
-    ## 🛠️ Technology Stack
-    
-    - **Backend**: Python, Pandas, Scikit-learn
-    - **Data Collection**: BeautifulSoup, Requests, RSS feeds
-    - **Visualization**: Plotly, Streamlit
-    - **Deployment**: Docker, Streamlit Cloud, GitHub Actions
-    
-    ## 🤝 Contributing
-    
-    Career Compass AI is **open source**! We welcome contributions from:
-    
-    - Data scientists and ML engineers
-    - Frontend and backend developers
-    - UX/UI designers
-    - Career coaches and HR professionals
-    
-    Check out our [GitHub repository](https://github.com/chm-hibatallah/career-compass-ai) 
-    for contribution guidelines.
-    
-    ## 📞 Contact & Links
-    
-    - **GitHub**: [github.com/chm-hibatallah/career-compass-ai](https://github.com/chm-hibatallah/career-compass-ai)
-    - **Portfolio**: [Your Portfolio Link]
-    - **LinkedIn**: [Your LinkedIn Profile]
-    
-    ## 📄 License
-    
-    This project is licensed under the **MIT License** - see the [LICENSE](LICENSE) file for details.
-    
-    ## 🙏 Acknowledgments
+    st.markdown(_ABOUT_MD)
+
+_SIDEBAR_HEADER_HTML: Final[str] = """<div style="text-align: center; margin-bottom: 2rem;">
+    <h1 style="color: #2563eb; margin-bottom: 0;">🧭</h1>
+    <h2 style="margin-top: 0;">Career Compass</h2>
+</div>"""
+
+_FOOTER_HTML: Final[str] = """<div style="text-align: center; color: #6b7280; font-size: 0.9rem;">
+    <p>
+        🧭 <b>Career Compass AI</b> • Data-driven career planning • 
+        <a href="https://github.com/chm-hibatallah/career-compass-ai" target="_blank">GitHub</a> • 
+        Made with ❤️ for data science students
+    </p>
+    <p style="font-size: 0.8rem;">
+        Uses real data from Stack Overflow, GitHub Jobs, and realistic market samples
+    </p>
+</div>"""
+
+# Navigation label -> page renderer, in sidebar order
+_PAGES: Final[Mapping[str, Callable[[], None]]] = types.MappingProxyType({
+    "🏠 Home": show_home_page,
+    "📊 Market Intelligence": show_market_page,
+    "🎯 Career Analysis": show_analysis_page,
+    "💰 ROI Calculator": show_roi_page,
+    "🔮 Future Forecasting": show_forecasting_page,
+    "ℹ️ About": show_about_page,
+})
+
+def _inject_css():
+    """Emit the global stylesheet.
     
-    - Built as a portfolio project by [Your Name]
-    - Inspired by the need for data-driven career decisions
-    - Special thanks to all open-source contributors
-    """)
+    Streamlit drops elements that are not re-emitted, so this runs every rerun.
+    """
+    st.markdown(load_css(), unsafe_allow_html=True)
 
 def main():
     """Main application function"""
+    _inject_css()
     
     # Show loading spinner on first run
     if not st.session_state.data_loaded:
@@ -971,19 +1243,14 @@ def main():
     
     # Sidebar
     with st.sidebar:
-        st.markdown("""
-        <div style="text-align: center; margin-bottom: 2rem;">
-            <h1 style="color: #2563eb; margin-bottom: 0;">🧭</h1>
-            <h2 style="margin-top: 0;">Career Compass</h2>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_SIDEBAR_HEADER_HTML, unsafe_allow_html=True)
         
         # Navigation
         page = st.radio(
             "Navigate:",
-            ["🏠 Home", "📊 Market Intelligence", "🎯 Career Analysis", 
-             "💰 ROI Calculator", "🔮 Future Forecasting", "ℹ️ About"],
-            label_visibility="collapsed"
+            tuple(_PAGES),
+            label_visibility="collapsed",
+            key="nav_page"
         )
         
         st.divider()
@@ -992,16 +1259,13 @@ def main():
         st.markdown("### 📈 Quick Stats")
         
         if st.session_state.jobs_df is not None and not st.session_state.jobs_df.empty:
-            df = st.session_state.jobs_df
-            total_jobs = len(df)
+            stats = _job_stats(st.session_state.jobs_df)
             
-            if 'data_quality' in df.columns:
-                real_data = len(df[df['data_quality'] == 'real'])
-                st.metric("Real Data Jobs", real_data)
+            if stats.n_real is not None:
+                st.metric("Real Data Jobs", stats.n_real)
             
-            if 'source' in df.columns:
-                sources = df['source'].nunique()
-                st.metric("Data Sources", sources)
+            if stats.n_sources is not None:
+                st.metric("Data Sources", stats.n_sources)
         
         st.divider()
         
@@ -1011,61 +1275,49 @@ def main():
         with st.form("quick_profile"):
             current_role = st.selectbox(
                 "Current Role",
-                ["Student", "Data Analyst", "Software Engineer", "Other"]
+                ["Student", "Data Analyst", "Software Engineer", "Other"],
+                key="profile_current_role"
             )
             
-            if st.form_submit_button("💾 Save Profile", type="secondary"):
+            if st.form_submit_button("💾 Save Profile", type="secondary", key="profile_save_btn"):
                 st.success("Profile saved!")
         
         st.divider()
         
         # Data refresh
-        if st.button("🔄 Refresh Data", use_container_width=True):
-            st.cache_data.clear()
-            st.session_state.data_loaded = False
-            st.rerun()
+        if st.button("🔄 Refresh Data", use_container_width=True, key="refresh_btn"):
+            # Ignore rapid repeat clicks so a double-click reloads only once
+            now = time.monotonic()
+            if now - st.session_state.get("_last_refresh", float("-inf")) > _REFRESH_DEBOUNCE_SECONDS:
+                st.session_state["_last_refresh"] = now
+                # Drop the job data and the analytics derived from it
+                from app.pages.analysis import clear_analytics_caches
+                _load_job_data_shared.clear()
+                clear_analytics_caches()
+                st.session_state["_force_refresh"] = True
+                st.session_state.data_loaded = False
+                st.rerun()
         
         # Footer
+        settings = get_settings()
         st.markdown("---")
         st.markdown(
             '<div style="text-align: center; font-size: 0.8rem; color: #6b7280;">'
-            'Career Compass AI v1.0.0<br>'
+            f'{settings.APP_NAME} v{settings.VERSION}<br>'
             'Data updates daily'
             '</div>',
             unsafe_allow_html=True
         )
     
     # Main content
-    if page == "🏠 Home":
-        show_home_page()
-    elif page == "📊 Market Intelligence":
-        show_market_page()
-    elif page == "🎯 Career Analysis":
-        show_analysis_page()
-    elif page == "💰 ROI Calculator":
-        show_roi_page()
-    elif page == "🔮 Future Forecasting":
-        show_forecasting_page()
-    elif page == "ℹ️ About":
-        show_about_page()
+    _PAGES.get(page, show_home_page)()
     
     # Global footer
     st.markdown("---")
-    st.markdown(
-        """
-        <div style="text-align: center; color: #6b7280; font-size: 0.9rem;">
-            <p>
-                🧭 <b>Career Compass AI</b> • Data-driven career planning • 
-                <a href="https://github.com/chm-hibatallah/career-compass-ai" target="_blank">GitHub</a> • 
-                Made with ❤️ for data science students
-            </p>
-            <p style="font-size: 0.8rem;">
-                Uses real data from Stack Overflow, GitHub Jobs, and realistic market samples
-            </p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
+    
+    # Fallbacks are only known once the shared resources have been built
+    _show_fallback_notices()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,15 +3,148 @@ Analysis pages for the Streamlit app
 """
 import streamlit as st
 import pandas as pd
-from typing import Dict, List
-import sys
-import os
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 from app.components.dashboard import DashboardComponents
-from app.utils.helpers import get_cached_data, cache_data, format_currency, format_percentage
+from app.utils.helpers import (
+    calculate_hash, compat_fragment, format_currency, format_currency_series, format_percentage
+)
+
+# Simulated related skills, keyed by lower-cased skill name
+_RELATED_SKILLS: Dict[str, Tuple[str, ...]] = {
+    "python": ("Django", "Flask", "FastAPI", "Pandas", "NumPy"),
+    "aws": ("Docker", "Kubernetes", "Terraform", "CI/CD"),
+    "machine learning": ("TensorFlow", "PyTorch", "scikit-learn", "Statistics"),
+    "docker": ("Kubernetes", "AWS", "CI/CD", "DevOps"),
+    "sql": ("PostgreSQL", "MySQL", "Data Warehousing", "ETL")
+}
+
+# Simulated salary premium by seniority
+_SALARY_IMPACT: Tuple[Tuple[str, int], ...] = (
+    ("Entry Level", 10000),
+    ("Mid Level", 20000),
+    ("Senior Level", 35000)
+)
+
+def _related_skills_for(skill_query: str) -> List[Tuple[str, ...]]:
+    """Related-skill groups for a query; exact names hit the dict directly,
+    longer queries (e.g. "python and sql") fall back to a substring scan"""
+    query = skill_query.strip().lower()
+    related = _RELATED_SKILLS.get(query)
+    if related is not None:
+        return [related]
+    return [group for skill, group in _RELATED_SKILLS.items() if skill in query]
+
+# Analytics results are memoised with st.cache_data across reruns and sessions.
+# Engines are not hashable, so they are passed as underscore arguments (skipped
+# by Streamlit's hasher) alongside a fingerprint of the data they were built on.
+_ANALYTICS_TTL = 24 * 3600
+
+def _data_key(engine) -> str:
+    """Cache key for an engine's market data.
+    
+    Frames from the shared loader carry a 'loaded_at' stamp, which identifies
+    them cheaply; other frames are hashed by content. id(engine) is not used
+    because CPython reuses ids once an engine is garbage-collected.
+    """
+    data = getattr(engine, "market_data", None)
+    if data is None:
+        data = getattr(engine, "jobs_df", None)
+    if isinstance(data, pd.DataFrame) and "loaded_at" in data.attrs:
+        return f"{type(engine).__name__}:{data.attrs['loaded_at']}:{len(data)}"
+    return f"{type(engine).__name__}:{calculate_hash(data)}"
+
+@st.cache_data(ttl=_ANALYTICS_TTL, show_spinner=False)
+def _cached_skill_demand(data_key: str, _market_engine, skill_query: str) -> Dict:
+    """Memoised skill demand lookup; callers pass the query already stripped and lower-cased"""
+    return _market_engine._calculate_skill_demand(skill_query)
+
+@st.cache_data(ttl=_ANALYTICS_TTL, show_spinner=False)
+def _cached_emerging_tech(data_key: str, _market_engine) -> List[Dict]:
+    """Memoised emerging technology detection"""
+    return _market_engine._detect_emerging_tech()
+
+@st.cache_data(ttl=_ANALYTICS_TTL, show_spinner=False)
+def _cached_transition(data_key: str, _simulator, current_role: str, target_role: str,
+                       current_skills: Tuple[str, ...]) -> Dict:
+    """Memoised CareerTransitionSimulator.analyze_transition"""
+    return _simulator.analyze_transition(current_role, target_role, list(current_skills))
+
+@st.cache_data(ttl=_ANALYTICS_TTL, show_spinner=False)
+def _cached_roadmap(data_key: str, _simulator, current_role: str, target_role: str,
+                    current_skills: Tuple[str, ...], timeline_months: int) -> Dict:
+    """Memoised CareerTransitionSimulator.generate_transition_roadmap"""
+    return _simulator.generate_transition_roadmap(
+        current_role, target_role, list(current_skills), timeline_months
+    )
+
+@st.cache_data(ttl=_ANALYTICS_TTL, show_spinner=False)
+def _cached_skill_comparison(data_key: str, _roi_calculator, skills: Tuple[str, ...],
+                             hours_per_week: int) -> pd.DataFrame:
+    """Memoised ROICalculator.compare_multiple_skills"""
+    return _roi_calculator.compare_multiple_skills(list(skills), hours_per_week)
+
+@st.cache_data(ttl=_ANALYTICS_TTL, show_spinner=False)
+def _cached_learning_plan(data_key: str, _roi_calculator, current_skills: Tuple[str, ...],
+                          target_skills: Tuple[str, ...], hours_per_week: int,
+                          timeline_weeks: int) -> Dict:
+    """Memoised ROICalculator.generate_learning_plan"""
+    return _roi_calculator.generate_learning_plan(
+        list(current_skills), list(target_skills), hours_per_week, timeline_weeks=timeline_weeks
+    )
+
+def clear_analytics_caches() -> None:
+    """Drop memoised analytics results, e.g. after the job data is reloaded"""
+    for cached in (_cached_skill_demand, _cached_emerging_tech, _cached_transition,
+                   _cached_roadmap, _cached_skill_comparison, _cached_learning_plan):
+        cached.clear()
+
+# Simulated demand projection for the forecasting chart
+_GROWTH_SKILLS = ("LangChain", "Ray", "Kubernetes", "FastAPI", "MLOps")
+_GROWTH_CURRENT = (25, 35, 70, 45, 55)
+_GROWTH_FUTURE = (65, 60, 85, 70, 80)
+
+# Figures are cached per input tuple, like the dashboard components, so
+# unchanged data skips the rebuild; st.cache_data returns a copy per call.
+@st.cache_data(max_entries=64, show_spinner=False)
+def _skill_bar_fig(skills: Tuple[str, ...], values: Tuple[float, ...], title: str,
+                   yaxis_title: str, color: str) -> "go.Figure":
+    """Single-series bar chart of a per-skill metric"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[go.Bar(x=skills, y=values, marker_color=color)])
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title="Skill",
+        yaxis_title=yaxis_title,
+        height=400
+    )
+    
+    return fig
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _growth_bar_fig(forecast_horizon: str) -> "go.Figure":
+    """Current vs projected demand for the forecast horizon"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[
+        go.Bar(name='Current', x=_GROWTH_SKILLS, y=_GROWTH_CURRENT),
+        go.Bar(name=f'Future ({forecast_horizon})', x=_GROWTH_SKILLS, y=_GROWTH_FUTURE)
+    ])
+    
+    fig.update_layout(
+        title="Skill Demand Growth Projection",
+        barmode='group',
+        xaxis_title="Skill",
+        yaxis_title="Demand Score",
+        height=500
+    )
+    
+    return fig
 
 def show_skill_analysis_page(market_data: pd.DataFrame, 
                            skill_extractor, 
@@ -19,18 +152,26 @@ def show_skill_analysis_page(market_data: pd.DataFrame,
     """Show skill analysis page"""
     st.header("🔍 Skill Analysis")
     
-    # Skill search
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        skill_query = st.text_input("Search for a skill:", placeholder="e.g., Python, Docker, AWS")
-    
-    with col2:
-        analysis_type = st.selectbox("Analysis Type", ["Demand", "Trend", "Salary Impact"])
+    # Skill search; inside a form, typing doesn't rerun until the query is submitted
+    with st.form("skill_form"):
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            skill_query = st.text_input("Search for a skill:", placeholder="e.g., Python, Docker, AWS")
+        
+        with col2:
+            analysis_type = st.selectbox("Analysis Type", ["Demand", "Trend", "Salary Impact"])
+        
+        st.form_submit_button("Analyze", type="primary")
     
+    # Form widgets keep their last submitted value, so results stay up while
+    # the ROI inputs below rerun the page
     if skill_query:
-        # Get skill analysis
-        skill_demand = market_engine._calculate_skill_demand(skill_query)
+        # Get skill analysis; the query is normalised first so "Python" and
+        # " python " share one cache entry
+        skill_demand = _cached_skill_demand(
+            _data_key(market_engine), market_engine, skill_query.strip().lower()
+        )
         
         # Display metrics
         cols = st.columns(3)
@@ -82,24 +223,13 @@ def show_skill_analysis_page(market_data: pd.DataFrame,
             # Related skills (from ontology)
             st.info("Related skills often appear together in job postings")
             
-            # Simulated related skills
-            related_skills = {
-                "Python": ["Django", "Flask", "FastAPI", "Pandas", "NumPy"],
-                "AWS": ["Docker", "Kubernetes", "Terraform", "CI/CD"],
-                "Machine Learning": ["TensorFlow", "PyTorch", "scikit-learn", "Statistics"],
-                "Docker": ["Kubernetes", "AWS", "CI/CD", "DevOps"],
-                "SQL": ["PostgreSQL", "MySQL", "Data Warehousing", "ETL"]
-            }
-            
-            for skill, related in related_skills.items():
-                if skill.lower() in skill_query.lower():
-                    for related_skill in related:
-                        DashboardComponents.skill_card(
-                            related_skill,
-                            level="intermediate",
-                            demand="high",
-                            hours=30
-                        )
+            for related in _related_skills_for(skill_query):
+                DashboardComponents.skill_cards(
+                    related,
+                    level="intermediate",
+                    demand="high",
+                    hours=30
+                )
         
         with tab3:
             # Salary impact analysis
@@ -108,19 +238,10 @@ def show_skill_analysis_page(market_data: pd.DataFrame,
             Estimated salary premium for having this skill:
             """)
             
-            # Simulated salary data
-            salary_impact = {
-                "Entry Level": 10000,
-                "Mid Level": 20000,
-                "Senior Level": 35000
-            }
-            
-            for level, impact in salary_impact.items():
-                col1, col2 = st.columns([2, 1])
-                with col1:
-                    st.markdown(f"**{level}**")
-                with col2:
-                    st.markdown(f"**+{format_currency(impact)}**")
+            rows = "\n".join(
+                f"| **{level}** | **+{format_currency(impact)}** |" for level, impact in _SALARY_IMPACT
+            )
+            st.markdown(f"| Level | Premium |\n|---|---|\n{rows}")
             
             # ROI calculation
             st.subheader("ROI Calculation")
@@ -182,8 +303,9 @@ def show_career_transition_page(market_data: pd.DataFrame,
     if st.button("Analyze Transition", type="primary"):
         with st.spinner("Analyzing career transition..."):
             # Get transition analysis
-            analysis = transition_simulator.analyze_transition(
-                current_role, target_role, current_skills
+            analysis = _cached_transition(
+                _data_key(transition_simulator), transition_simulator,
+                current_role, target_role, tuple(current_skills)
             )
             
             if 'error' not in analysis:
@@ -232,13 +354,16 @@ def show_career_transition_page(market_data: pd.DataFrame,
                 
                 with tab1:
                     st.markdown("#### Skills You Need to Learn:")
-                    for skill in analysis['transition_analysis']['missing_core_skills'][:10]:
-                        DashboardComponents.skill_card(skill, level="intermediate", demand="high")
+                    DashboardComponents.skill_cards(
+                        analysis['transition_analysis']['missing_core_skills'][:10],
+                        level="intermediate", demand="high"
+                    )
                 
                 with tab2:
                     # Generate learning path
-                    roadmap = transition_simulator.generate_transition_roadmap(
-                        current_role, target_role, current_skills, timeline_months
+                    roadmap = _cached_roadmap(
+                        _data_key(transition_simulator), transition_simulator,
+                        current_role, target_role, tuple(current_skills), timeline_months
                     )
                     
                     if 'roadmap' in roadmap:
@@ -246,14 +371,14 @@ def show_career_transition_page(market_data: pd.DataFrame,
                         
                         for phase_name, phase_data in roadmap['roadmap'].items():
                             with st.expander(f"{phase_name.replace('_', ' ').title()} - {phase_data['duration']}"):
-                                st.markdown(f"**Focus:** {phase_data['focus']}")
-                                st.markdown("**Key Skills:**")
-                                for skill in phase_data['skills']:
-                                    st.markdown(f"- {skill}")
-                                
-                                st.markdown("**Milestones:**")
-                                for milestone in phase_data['milestones']:
-                                    st.markdown(f"✓ {milestone}")
+                                # One markdown element per phase
+                                skills_md = "\n".join(f"- {skill}" for skill in phase_data['skills'])
+                                milestones_md = "\n\n".join(f"✓ {m}" for m in phase_data['milestones'])
+                                st.markdown(
+                                    f"**Focus:** {phase_data['focus']}\n\n"
+                                    f"**Key Skills:**\n\n{skills_md}\n\n"
+                                    f"**Milestones:**\n\n{milestones_md}"
+                                )
                 
                 with tab3:
                     st.markdown("#### Market Outlook for Target Role:")
@@ -265,12 +390,10 @@ def show_career_transition_page(market_data: pd.DataFrame,
                         "Remote Opportunities": "High"  # Simulated
                     }
                     
-                    for metric, value in market_outlook.items():
-                        col1, col2 = st.columns([1, 2])
-                        with col1:
-                            st.markdown(f"**{metric}:**")
-                        with col2:
-                            st.markdown(value)
+                    rows = "\n".join(
+                        f"| **{metric}** | {value} |" for metric, value in market_outlook.items()
+                    )
+                    st.markdown(f"| Metric | Outlook |\n|---|---|\n{rows}")
                 
                 # Recommendations
                 st.subheader("🎯 Recommendations")
@@ -283,12 +406,136 @@ def show_career_transition_page(market_data: pd.DataFrame,
                     "Update your LinkedIn profile with new skills"
                 ]
                 
-                for i, recommendation in enumerate(recommendations, 1):
-                    st.markdown(f"{i}. {recommendation}")
+                st.markdown("\n".join(f"{i}. {rec}" for i, rec in enumerate(recommendations, 1)))
             
             else:
                 st.error(f"Error: {analysis['error']}")
 
+def _render_roi_comparison(roi_calculator, comparison_df: pd.DataFrame,
+                           skills_to_evaluate: Tuple[str, ...], hours_per_week: int,
+                           target_role: str):
+    """Comparison table, charts and learning plan for one ROI calculation"""
+    if not comparison_df.empty:
+        # Display comparison table
+        st.subheader("ROI Comparison")
+        DashboardComponents.create_comparison_table(comparison_df)
+        
+        # Visualizations
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # ROI Score Chart
+            fig = _skill_bar_fig(
+                tuple(comparison_df['skill']), tuple(comparison_df['roi_score']),
+                "ROI Score by Skill", "ROI Score", '#2563EB'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            # Salary Increase Chart
+            fig = _skill_bar_fig(
+                tuple(comparison_df['skill']), tuple(comparison_df['salary_increase']),
+                "Estimated Salary Increase", "Annual Salary Increase ($)", '#10B981'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Recommendations
+        st.subheader("🎯 Skill Investment Strategy")
+        
+        # Sort by ROI score
+        top_skills = comparison_df.nlargest(3, 'roi_score')
+        
+        st.markdown("### Top 3 Skills by ROI:")
+        
+        rows = "\n".join(
+            f"| **#{row.Index + 1}** | **{row.skill}** | *{row.recommendation}* | {row.roi_score}/100 |"
+            for row in top_skills.itertuples(index=True, name="SkillRow")
+        )
+        st.markdown(f"| # | Skill | Recommendation | ROI Score |\n|---|---|---|---|\n{rows}")
+        
+        # Learning plan
+        if target_role:
+            st.subheader("📚 Optimized Learning Plan")
+            
+            learning_plan = _cached_learning_plan(
+                _data_key(roi_calculator), roi_calculator,
+                (),  # Empty for current skills (simplified)
+                tuple(skills_to_evaluate),
+                hours_per_week,
+                timeline_weeks=26  # 6 months
+            )
+            
+            if 'learning_plan' in learning_plan:
+                plan_df = pd.DataFrame(learning_plan['learning_plan'])
+                
+                st.markdown("#### Suggested Learning Order:")
+                if not plan_df.empty:
+                    # One table for the whole plan instead of a markdown block per skill
+                    plan_table = pd.DataFrame({
+                        "Skill": plan_df['skill'],
+                        "Priority": plan_df['priority'],
+                        "Estimated Weeks": plan_df['estimated_weeks'],
+                        "Salary Impact": "+" + format_currency_series(plan_df['salary_impact']),
+                        "ROI Score": plan_df['roi_score'],
+                    })
+                    plan_table.index = range(1, len(plan_table) + 1)
+                    st.dataframe(
+                        plan_table,
+                        use_container_width=True,
+                        column_config={
+                            "Estimated Weeks": st.column_config.NumberColumn(format="%.1f"),
+                            "ROI Score": st.column_config.NumberColumn(format="%d/100"),
+                        },
+                    )
+                
+                # Plan metrics
+                metrics = learning_plan['metrics']
+                
+                cols = st.columns(3)
+                with cols[0]:
+                    st.metric("Total Timeline", f"{metrics['total_weeks']:.1f} weeks")
+                with cols[1]:
+                    st.metric("Salary Impact", format_currency(metrics['estimated_salary_impact']))
+                with cols[2]:
+                    st.metric("Efficiency Score", f"{metrics['plan_efficiency_score']:.1f}/100")
+    else:
+        st.warning("Could not calculate ROI for selected skills")
+
+# Clicking Calculate reruns only the results panel, not the inputs above it
+@compat_fragment
+def _roi_results(roi_calculator, skills_to_evaluate: Tuple[str, ...], hours_per_week: int,
+                 target_role: str):
+    """Calculate button and ROI results for the ROI calculator page"""
+    # The last comparison is kept per session and keyed on the engine's data
+    # as well as the inputs, so it is never shown against refreshed data
+    result_key = calculate_hash({
+        "data": _data_key(roi_calculator),
+        "skills": skills_to_evaluate,
+        "hours_per_week": hours_per_week,
+    })
+    stored = st.session_state.get("roi_result")
+    
+    if st.button("Calculate ROI for All Skills", type="primary"):
+        if not skills_to_evaluate:
+            st.warning("Please select at least one skill to evaluate")
+        else:
+            with st.spinner("Calculating ROI for each skill..."):
+                # Get ROI comparison
+                comparison_df = _cached_skill_comparison(
+                    _data_key(roi_calculator), roi_calculator, skills_to_evaluate, hours_per_week
+                )
+                st.session_state["roi_result"] = (result_key, comparison_df)
+                _render_roi_comparison(
+                    roi_calculator, comparison_df, skills_to_evaluate, hours_per_week, target_role
+                )
+    elif stored is not None and stored[0] == result_key:
+        # Unrelated widget changes (e.g. the role selectors) redisplay the last result
+        st.info("Showing your last ROI calculation for these skills. "
+                "Press **Calculate ROI for All Skills** to recalculate.")
+        _render_roi_comparison(
+            roi_calculator, stored[1], skills_to_evaluate, hours_per_week, target_role
+        )
+
 def show_roi_calculator_page(market_data: pd.DataFrame, roi_calculator):
     """Show ROI calculator page"""
     st.header("💰 ROI Calculator")
@@ -324,119 +571,7 @@ def show_roi_calculator_page(market_data: pd.DataFrame, roi_calculator):
             key="roi_target_role"
         )
     
-    if st.button("Calculate ROI for All Skills", type="primary"):
-        if not skills_to_evaluate:
-            st.warning("Please select at least one skill to evaluate")
-        else:
-            with st.spinner("Calculating ROI for each skill..."):
-                # Get ROI comparison
-                comparison_df = roi_calculator.compare_multiple_skills(
-                    skills_to_evaluate, hours_per_week
-                )
-                
-                if not comparison_df.empty:
-                    # Display comparison table
-                    st.subheader("ROI Comparison")
-                    DashboardComponents.create_comparison_table(comparison_df)
-                    
-                    # Visualizations
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        # ROI Score Chart
-                        fig = go.Figure(data=[
-                            go.Bar(
-                                x=comparison_df['skill'],
-                                y=comparison_df['roi_score'],
-                                marker_color='#2563EB'
-                            )
-                        ])
-                        
-                        fig.update_layout(
-                            title="ROI Score by Skill",
-                            xaxis_title="Skill",
-                            yaxis_title="ROI Score",
-                            height=400
-                        )
-                        
-                        st.plotly_chart(fig, use_container_width=True)
-                    
-                    with col2:
-                        # Salary Increase Chart
-                        fig = go.Figure(data=[
-                            go.Bar(
-                                x=comparison_df['skill'],
-                                y=comparison_df['salary_increase'],
-                                marker_color='#10B981'
-                            )
-                        ])
-                        
-                        fig.update_layout(
-                            title="Estimated Salary Increase",
-                            xaxis_title="Skill",
-                            yaxis_title="Annual Salary Increase ($)",
-                            height=400
-                        )
-                        
-                        st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Recommendations
-                    st.subheader("🎯 Skill Investment Strategy")
-                    
-                    # Sort by ROI score
-                    top_skills = comparison_df.nlargest(3, 'roi_score')
-                    
-                    st.markdown("### Top 3 Skills by ROI:")
-                    
-                    for idx, row in top_skills.iterrows():
-                        col1, col2, col3 = st.columns([1, 2, 1])
-                        
-                        with col1:
-                            st.markdown(f"**#{idx + 1}**")
-                        
-                        with col2:
-                            st.markdown(f"**{row['skill']}**")
-                            st.markdown(f"*{row['recommendation']}*")
-                        
-                        with col3:
-                            st.metric("ROI Score", f"{row['roi_score']}/100")
-                    
-                    # Learning plan
-                    if target_role:
-                        st.subheader("📚 Optimized Learning Plan")
-                        
-                        learning_plan = roi_calculator.generate_learning_plan(
-                            [],  # Empty list for current skills (simplified)
-                            skills_to_evaluate,
-                            hours_per_week,
-                            timeline_weeks=26  # 6 months
-                        )
-                        
-                        if 'learning_plan' in learning_plan:
-                            plan_df = pd.DataFrame(learning_plan['learning_plan'])
-                            
-                            st.markdown("#### Suggested Learning Order:")
-                            for i, item in enumerate(learning_plan['learning_plan'], 1):
-                                st.markdown(f"""
-                                **{i}. {item['skill']}**
-                                - Priority: {item['priority']}
-                                - Estimated: {item['estimated_weeks']:.1f} weeks
-                                - Salary Impact: +{format_currency(item['salary_impact'])}
-                                - ROI Score: {item['roi_score']}/100
-                                """)
-                            
-                            # Plan metrics
-                            metrics = learning_plan['metrics']
-                            
-                            cols = st.columns(3)
-                            with cols[0]:
-                                st.metric("Total Timeline", f"{metrics['total_weeks']:.1f} weeks")
-                            with cols[1]:
-                                st.metric("Salary Impact", format_currency(metrics['estimated_salary_impact']))
-                            with cols[2]:
-                                st.metric("Efficiency Score", f"{metrics['plan_efficiency_score']:.1f}/100")
-                else:
-                    st.warning("Could not calculate ROI for selected skills")
+    _roi_results(roi_calculator, tuple(skills_to_evaluate), hours_per_week, target_role)
 
 def show_forecasting_page(market_engine):
     """Show forecasting page"""
@@ -447,15 +582,17 @@ def show_forecasting_page(market_engine):
     This helps you future-proof your career by learning emerging technologies early.
     """)
     
-    # Time horizon selection
-    forecast_horizon = st.select_slider(
-        "Forecast Horizon",
-        options=["3 months", "6 months", "1 year", "2 years"],
-        value="6 months"
-    )
+    # Time horizon selection, applied on submit rather than on every drag
+    with st.form("forecast_form"):
+        forecast_horizon = st.select_slider(
+            "Forecast Horizon",
+            options=["3 months", "6 months", "1 year", "2 years"],
+            value="6 months"
+        )
+        st.form_submit_button("Update Forecast")
     
     # Get emerging tech analysis
-    emerging_tech = market_engine._detect_emerging_tech()
+    emerging_tech = _cached_emerging_tech(_data_key(market_engine), market_engine)
     
     if emerging_tech:
         st.subheader("🚀 Emerging Technologies")
@@ -482,31 +619,7 @@ def show_forecasting_page(market_engine):
         # Skill growth predictions
         st.subheader("📈 Skill Growth Predictions")
         
-        # Simulated growth data
-        growth_data = {
-            "Skill": ["LangChain", "Ray", "Kubernetes", "FastAPI", "MLOps"],
-            "Current Demand": [25, 35, 70, 45, 55],
-            f"Demand in {forecast_horizon}": [65, 60, 85, 70, 80],
-            "Growth": ["+160%", "+71%", "+21%", "+56%", "+45%"]
-        }
-        
-        growth_df = pd.DataFrame(growth_data)
-        
-        # Create growth chart
-        fig = go.Figure(data=[
-            go.Bar(name='Current', x=growth_df['Skill'], y=growth_df['Current Demand']),
-            go.Bar(name=f'Future ({forecast_horizon})', x=growth_df['Skill'], y=growth_df[f'Demand in {forecast_horizon}'])
-        ])
-        
-        fig.update_layout(
-            title=f"Skill Demand Growth Projection",
-            barmode='group',
-            xaxis_title="Skill",
-            yaxis_title="Demand Score",
-            height=500
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(_growth_bar_fig(forecast_horizon), use_container_width=True)
         
         # Recommendations
         st.subheader("🎯 Future-Proofing Recommendations")
@@ -7,11 +7,13 @@ from app.utils.helpers import (
     calculate_hash,
     safe_divide,
     format_currency,
+    format_currency_series,
     format_percentage,
     create_progress_bar,
     get_color_for_score,
     validate_user_input,
-    time_it
+    time_it,
+    compat_fragment
 )
 
 __all__ = [
@@ -20,9 +22,11 @@ __all__ = [
     'calculate_hash',
     'safe_divide',
     'format_currency',
+    'format_currency_series',
     'format_percentage',
     'create_progress_bar',
     'get_color_for_score',
     'validate_user_input',
-    'time_it'
+    'time_it',
+    'compat_fragment'
 ]
\ No newline at end of file
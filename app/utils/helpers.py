@@ -5,13 +5,26 @@ import json
 import yaml
 import pickle
 import hashlib
+from functools import lru_cache
 from typing import Any, Dict, List
 from datetime import datetime, timedelta
 import pandas as pd
+from pandas.util import hash_pandas_object
 import numpy as np
 import streamlit as st
 from pathlib import Path
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+try:
+    import xxhash
+except ImportError:  # optional speed-up; hashlib.blake2b is used without it
+    xxhash = None
+
 def cache_data(data: Any, key: str, expiration_hours: int = 24) -> None:
     """Cache data to Streamlit session state"""
     if 'cache' not in st.session_state:
@@ -40,16 +53,26 @@ def get_cached_data(key: str) -> Any:
     
     return cache_entry['data']
 
+def _digest(payload: bytes) -> str:
+    """Fast non-cryptographic digest: xxh3 when available, else blake2b"""
+    if xxhash is not None:
+        return xxhash.xxh3_64(payload).hexdigest()
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
 def calculate_hash(data: Any) -> str:
     """Calculate hash of data for caching"""
     if isinstance(data, pd.DataFrame):
-        data_str = data.to_string()
+        try:
+            row_hashes = hash_pandas_object(data, index=True)
+        except TypeError:
+            # Unhashable cells (e.g. skill lists) are hashed by their text form
+            row_hashes = hash_pandas_object(data.astype(str), index=True)
+        columns = json.dumps([str(c) for c in data.columns]).encode()
+        return _digest(columns + row_hashes.values.tobytes())
     elif isinstance(data, dict):
-        data_str = json.dumps(data, sort_keys=True)
-    else:
-        data_str = str(data)
+        return _digest(json.dumps(data, sort_keys=True, default=str).encode())
     
-    return hashlib.md5(data_str.encode()).hexdigest()
+    return _digest(repr(data).encode())
 
 def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> float:
     """Safe division with default value on zero denominator"""
@@ -57,8 +80,9 @@ def safe_divide(numerator: float, denominator: float, default: float = 0.0) -> f
         return default
     return numerator / denominator
 
+@lru_cache(maxsize=512)
 def format_currency(amount: float) -> str:
-    """Format number as currency"""
+    """Format number as currency (memoised; inputs repeat across reruns)"""
     if amount >= 1_000_000:
         return f"${amount/1_000_000:.1f}M"
     elif amount >= 1_000:
@@ -66,8 +90,23 @@ def format_currency(amount: float) -> str:
     else:
         return f"${amount:,.0f}"
 
+def format_currency_series(amounts: pd.Series) -> pd.Series:
+    """Format a whole Series as currency; same output as format_currency per value"""
+    values = amounts.to_numpy(dtype=float)
+    millions = values >= 1_000_000
+    thousands = (values >= 1_000) & ~millions
+    rest = ~(millions | thousands)
+    
+    # Each branch only formats its own subset
+    out = np.empty(len(values), dtype=object)
+    out[millions] = [f"${x:.1f}M" for x in values[millions] / 1_000_000]
+    out[thousands] = [f"${x:.1f}K" for x in values[thousands] / 1_000]
+    out[rest] = [f"${x:,.0f}" for x in values[rest]]
+    return pd.Series(out, index=amounts.index, name=amounts.name)
+
+@lru_cache(maxsize=512)
 def format_percentage(value: float) -> str:
-    """Format as percentage"""
+    """Format as percentage (memoised)"""
     return f"{value:.1f}%"
 
 def create_progress_bar(value: float, total: float = 100) -> str:
@@ -81,14 +120,14 @@ def load_yaml_file(filepath: Path) -> Dict:
     """Load YAML file"""
     try:
         with open(filepath, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=SafeLoader)
     except FileNotFoundError:
         return {}
 
 def save_yaml_file(data: Dict, filepath: Path) -> None:
     """Save data to YAML file"""
     with open(filepath, 'w') as f:
-        yaml.dump(data, f, default_flow_style=False)
+        yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False)
 
 def get_color_for_score(score: float) -> str:
     """Get color based on score (0-100)"""
@@ -113,6 +152,11 @@ def validate_user_input(user_data: Dict) -> List[str]:
     
     return errors
 
+def compat_fragment(func):
+    """Wrap func in st.fragment, or st.experimental_fragment on older Streamlit"""
+    fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    return fragment(func) if fragment else func
+
 def time_it(func):
     """Decorator to measure execution time"""
     import time
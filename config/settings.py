@@ -1,19 +1,24 @@
 import os 
+from dataclasses import dataclass 
 from pathlib import Path 
  
 BASE_DIR = Path(__file__).resolve().parent.parent 
 DATA_DIR = BASE_DIR / "data" 
 LOG_DIR = BASE_DIR / "logs" 
  
-for dir_path in [DATA_DIR, LOG_DIR]: 
-    dir_path.mkdir(exist_ok=True) 
+def init_dirs() -> None: 
+    """Create the data and log directories; call once at app startup""" 
+    for dir_path in [DATA_DIR, LOG_DIR]: 
+        dir_path.mkdir(exist_ok=True) 
  
+# Environment is read once, when this module is first imported 
+@dataclass(frozen=True) 
 class Settings: 
-    APP_NAME = "Career Compass AI" 
-    VERSION = "1.0.0" 
-    DEBUG = os.getenv("DEBUG", "True").lower() == "true" 
-    ENABLE_REAL_API_CALLS = False 
-    DEFAULT_HOURS_PER_WEEK = 10 
-    DEFAULT_TIMELINE_MONTHS = 6 
+    APP_NAME: str = "Career Compass AI" 
+    VERSION: str = "1.0.0" 
+    DEBUG: bool = os.getenv("DEBUG", "True").lower() == "true" 
+    ENABLE_REAL_API_CALLS: bool = False 
+    DEFAULT_HOURS_PER_WEEK: int = 10 
+    DEFAULT_TIMELINE_MONTHS: int = 6 
  
 settings = Settings() 
@@ -1,6 +1,7 @@
 """
 Career transition simulation and analysis
 """
+import re
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
@@ -10,10 +11,32 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Phrases that mark a job description as belonging to a role
+_ROLE_TERMS: Dict[str, Tuple[str, ...]] = {
+    'data_analyst': ('data analyst', 'business analyst'),
+    'data_scientist': ('data scientist', 'data science'),
+    'machine_learning_engineer': ('machine learning engineer', 'ml engineer'),
+    'data_engineer': ('data engineer',),
+    'mlops_engineer': ('mlops', 'ml ops')
+}
+
+# Common role-name variations, in priority order
+_ROLE_ALIASES: Dict[str, str] = {
+    'data_analyst': 'data_analyst',
+    'data_scientist': 'data_scientist',
+    'machine_learning_engineer': 'machine_learning_engineer',
+    'ml_engineer': 'machine_learning_engineer',
+    'data_engineer': 'data_engineer',
+    'mlops_engineer': 'mlops_engineer',
+    'mlops': 'mlops_engineer'
+}
+
 class CareerTransitionSimulator:
     """Simulate career transitions and analyze feasibility"""
     
     def __init__(self, market_data: pd.DataFrame, ontology):
+        # Compiled role-term patterns, filled per role_key on first use
+        self._role_patterns: Dict[str, re.Pattern] = {}
         self.market_data = market_data
         self.ontology = ontology
         
@@ -51,6 +74,10 @@ class CareerTransitionSimulator:
             }
         }
         
+        # Core skills are static, so their lowercase lookup set is built once
+        for role_def in self.role_definitions.values():
+            role_def['_core_set'] = frozenset(s.lower() for s in role_def['core_skills'])
+        
         # Transition feasibility matrix
         self.transition_matrix = {
             'data_analyst': {
@@ -71,6 +98,16 @@ class CareerTransitionSimulator:
             }
         }
     
+    @property
+    def market_data(self) -> pd.DataFrame:
+        return self._market_data
+    
+    @market_data.setter
+    def market_data(self, market_data: pd.DataFrame):
+        self._market_data = market_data
+        # Role demand percentages per role_key; reset whenever the data is replaced
+        self._role_demand: Dict[str, float] = {}
+    
     def analyze_transition(self, current_role: str, target_role: str, 
                          current_skills: List[str]) -> Dict:
         """Analyze feasibility of career transition"""
@@ -89,12 +126,14 @@ class CareerTransitionSimulator:
         current_role_def = self.role_definitions[current_role_key]
         target_role_def = self.role_definitions[target_role_key]
         
-        # Calculate skill overlap
+        # Calculate skill overlap (hashed lookups; list order follows the inputs)
         current_lower = [s.lower() for s in current_skills]
+        current_set = frozenset(current_lower)
+        target_core_set = target_role_def['_core_set']
         target_core_lower = [s.lower() for s in target_role_def['core_skills']]
         
-        overlapping_skills = [s for s in current_lower if s in target_core_lower]
-        missing_skills = [s for s in target_core_lower if s not in current_lower]
+        overlapping_skills = [s for s in current_lower if s in target_core_set]
+        missing_skills = [s for s in target_core_lower if s not in current_set]
         
         # Calculate metrics
         skill_coverage = len(overlapping_skills) / len(target_core_lower) * 100
@@ -162,17 +201,7 @@ class CareerTransitionSimulator:
         role_lower = role.lower().replace(' ', '_')
         
         # Map common variations
-        role_mapping = {
-            'data_analyst': 'data_analyst',
-            'data_scientist': 'data_scientist',
-            'machine_learning_engineer': 'machine_learning_engineer',
-            'ml_engineer': 'machine_learning_engineer',
-            'data_engineer': 'data_engineer',
-            'mlops_engineer': 'mlops_engineer',
-            'mlops': 'mlops_engineer'
-        }
-        
-        for key, value in role_mapping.items():
+        for key, value in _ROLE_ALIASES.items():
             if key in role_lower:
                 return value
         
@@ -244,24 +273,22 @@ class CareerTransitionSimulator:
         if 'description' not in self.market_data.columns:
             return 50  # Default
         
-        # Search for role in descriptions
-        role_terms = {
-            'data_analyst': ['data analyst', 'business analyst'],
-            'data_scientist': ['data scientist', 'data science'],
-            'machine_learning_engineer': ['machine learning engineer', 'ml engineer'],
-            'data_engineer': ['data engineer'],
-            'mlops_engineer': ['mlops', 'ml ops']
-        }
+        # Every transition scans for both roles, so each role is counted once per dataset
+        if role_key in self._role_demand:
+            return self._role_demand[role_key]
         
-        terms = role_terms.get(role_key, [role_key.replace('_', ' ')])
+        pattern = self._role_patterns.get(role_key)
+        if pattern is None:
+            terms = _ROLE_TERMS.get(role_key, (role_key.replace('_', ' '),))
+            pattern = re.compile('|'.join(map(re.escape, terms)), re.IGNORECASE)
+            self._role_patterns[role_key] = pattern
         
-        count = 0
-        for desc in self.market_data['description'].astype(str).str.lower():
-            if any(term in desc for term in terms):
-                count += 1
+        # Search for role in descriptions
+        count = int(self.market_data['description'].astype(str).str.contains(pattern, na=False).sum())
         
         percentage = (count / len(self.market_data)) * 100
-        return round(percentage, 2)
+        self._role_demand[role_key] = round(percentage, 2)
+        return self._role_demand[role_key]
     
     def _analyze_role_growth(self, role_key: str) -> str:
         """Analyze growth trend for role"""
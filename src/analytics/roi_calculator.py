@@ -1,6 +1,7 @@
 """
 ROI Calculator for skill investments
 """
+import re
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
@@ -338,13 +338,15 @@ class FreeJobDataCollector:
         
         # Check for recent cache (less than 6 hours old)
         if use_cache:
-            cache_file = self.cache_dir / f"jobs_{datetime.now().strftime('%Y%m%d')}.parquet"
-            if cache_file.exists():
+            # Saved files carry an _HHMM suffix, so pick the newest one for today
+            cache_files = list(self.cache_dir.glob(f"jobs_{datetime.now().strftime('%Y%m%d')}_*.parquet"))
+            if cache_files:
+                cache_file = max(cache_files, key=lambda x: x.stat().st_mtime)
                 cache_age = datetime.now().timestamp() - cache_file.stat().st_mtime
                 if cache_age < 6 * 3600:  # 6 hours
                     logger.info(f"📁 Loading from recent cache: {cache_file}")
                     try:
-                        df = pd.read_parquet(cache_file)
+                        df = pd.read_parquet(cache_file, engine='pyarrow', memory_map=True)
                         if len(df) > 0:
                             logger.info(f"✅ Loaded {len(df)} jobs from cache")
                             return df
@@ -402,7 +404,7 @@ class FreeJobDataCollector:
             
             # Cache the results
             cache_file = self.cache_dir / f"jobs_{datetime.now().strftime('%Y%m%d_%H%M')}.parquet"
-            df.to_parquet(cache_file, compression='snappy')
+            df.to_parquet(cache_file, engine='pyarrow', compression='zstd')
             logger.info(f"💾 Saved {len(df)} jobs to cache: {cache_file}")
         
         logger.info(f"✅ Collection complete! Total jobs: {len(df)}")
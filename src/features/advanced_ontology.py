@@ -9,6 +9,12 @@ from collections import defaultdict
 import yaml
 from pathlib import Path
 
+# libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 class AdvancedSkillOntology:
     """Advanced skill ontology with hierarchies, prerequisites, and relationships"""
     
@@ -275,7 +281,7 @@ class AdvancedSkillOntology:
     def load_ontology(self, filepath: str):
         """Load ontology from file"""
         with open(filepath, 'r') as f:
-            ontology_data = yaml.safe_load(f)
+            ontology_data = yaml.load(f, Loader=SafeLoader)
         
         self.skill_categories = ontology_data.get('skill_categories', {})
         self.skill_relationships = ontology_data.get('skill_relationships', {})
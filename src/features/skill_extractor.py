@@ -2,7 +2,7 @@
 Skill extraction from job descriptions
 """
 import re
-from typing import List, Set, Dict
+from typing import List, Set, Dict, Tuple, Union
 import pandas as pd
 from collections import Counter
 
@@ -66,8 +66,13 @@ class SkillExtractor:
         
         return list(found_skills)
     
-    def extract_skills_from_dataframe(self, df: pd.DataFrame, text_column: str = "description") -> pd.DataFrame:
-        """Extract skills for all job postings"""
+    def extract_skills_from_dataframe(self, df: pd.DataFrame, text_column: str = "description",
+                                      as_series: bool = False) -> Tuple[pd.DataFrame, Union[Counter, pd.Series]]:
+        """Extract skills for all job postings
+        
+        Frequencies come back as a Counter, or with as_series=True as an
+        int32 Series sorted by count.
+        """
         print(f"Extracting skills from {len(df)} job postings...")
         
         # Extract skills
@@ -75,23 +80,22 @@ class SkillExtractor:
         
         # Combine with existing skills if available
         if "skills" in df.columns:
-            df["all_skills"] = df.apply(
-                lambda row: list(set(row["skills"] + row["extracted_skills"])) 
-                if isinstance(row["skills"], list) 
-                else row["extracted_skills"],
-                axis=1
-            )
+            df["all_skills"] = [
+                list(set(skills + extracted)) if isinstance(skills, list) else extracted
+                for skills, extracted in zip(df["skills"], df["extracted_skills"])
+            ]
         else:
             df["all_skills"] = df["extracted_skills"]
         
         # Create skill frequency analysis
-        all_skills_flat = [skill for skills in df["all_skills"] for skill in skills]
-        skill_freq = Counter(all_skills_flat)
+        skill_counts = df["all_skills"].explode().dropna().value_counts().astype("int32")
         
-        print(f"Found {len(skill_freq)} unique skills")
-        print(f"Top 10 skills: {skill_freq.most_common(10)}")
+        print(f"Found {len(skill_counts)} unique skills")
+        print(f"Top 10 skills: {list(skill_counts.head(10).items())}")
         
-        return df, skill_freq
+        if as_series:
+            return df, skill_counts
+        return df, Counter(skill_counts.to_dict())
     
     def get_skill_categories(self) -> Dict[str, List[str]]:
         """Get skills grouped by category for visualization"""